@@ -1,12 +1,200 @@
 import os
+import re
+import time
 import asyncio
 import logging
-from typing import List, Dict, Optional, Any
+from typing import AsyncIterator, Callable, List, Dict, Optional, Tuple, Any
 
 import httpx
+import ijson
+import orjson
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent connections / concurrently fetched pages
+MAX_CONNECTIONS = 20
+
+# Attempts per Socrata page before the whole paginated fetch fails
+PAGE_FETCH_ATTEMPTS = 3
+
+# httpx only decodes brotli when a brotli package is installed, so only advertise it then
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip"
+
+# Likewise httpx needs the h2 package to negotiate HTTP/2 (one multiplexed connection per host)
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Ask for compressed JSON; httpx decompresses transparently before resp.content
+DEFAULT_HEADERS = {"Accept-Encoding": ACCEPT_ENCODING, "Accept": "application/json"}
+
+# Whole-word LIMIT/OFFSET (so identifiers like `limitation` don't count)
+_LIMIT_OFFSET_RE = re.compile(r"\b(?:LIMIT|OFFSET)\b", re.IGNORECASE)
+
+# Pieces of a SoQL query that a count(*) rewrite must replace or drop
+_SOQL_SELECT_RE = re.compile(r"^\s*(?:SELECT\s+.*?)?(?=\bWHERE\b|\bORDER\s+BY\b|$)", re.IGNORECASE | re.DOTALL)
+_SOQL_ORDER_BY_RE = re.compile(r"\bORDER\s+BY\b.*$", re.IGNORECASE | re.DOTALL)
+_SOQL_GROUPING_RE = re.compile(r"\bGROUP\s+BY\b|\bHAVING\b", re.IGNORECASE)
+
+# Socrata only pages deterministically under a total order; the row id is one
+STABLE_ORDER = ":id"
+
+
+def _soql_has_paging(soql: str) -> bool:
+    """True if the SoQL query already carries its own LIMIT/OFFSET clause."""
+    return _LIMIT_OFFSET_RE.search(soql) is not None
+
+
+def _soql_page_query(soql: str, limit: int, offset: int) -> str:
+    """
+    Append one LIMIT/OFFSET page to a SoQL query, ordering by row id unless the
+    query brings its own ORDER BY (grouped queries have no row id to order by).
+    """
+    if not (_SOQL_ORDER_BY_RE.search(soql) or _SOQL_GROUPING_RE.search(soql)):
+        soql = f"{soql} ORDER BY {STABLE_ORDER}"
+    return f"{soql} LIMIT {limit} OFFSET {offset}"
+
+
+def _is_retryable_http_error(exc: BaseException) -> bool:
+    """Retry transport failures, 429s and 5xx; other HTTP statuses won't improve on retry."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+def _plain_page_params(
+    limit: int,
+    where: Optional[Dict[str, Any]],
+    select: Optional[str]
+) -> Tuple[Callable[[int], Dict[str, Any]], Dict[str, Any]]:
+    """Page-params factory and count params for `$limit/$offset` pagination."""
+    filters: Dict[str, Any] = {}
+    where_clause = _build_where(where) if where else ""
+    if where_clause:
+        filters["$where"] = where_clause
+    page_filters = {**filters, "$order": STABLE_ORDER}
+    if select:
+        page_filters["$select"] = select
+    count_params = {**filters, "$select": "count(*) AS count"}
+    return (lambda offset: {**page_filters, "$limit": limit, "$offset": offset}), count_params
+
+
+class _AsyncByteReader:
+    """Minimal async file-like adapter so ijson can parse an httpx byte stream."""
+
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            # ijson probes with read(0) to detect bytes vs str
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+class AsyncRateLimiter:
+    """
+    Leaky-bucket rate limiter: at most `max_rate` acquisitions per `time_period`
+    seconds, with bursts up to `max_rate`. Use as `async with limiter: ...`.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._leak_rate = max_rate / time_period
+        self._level = 0.0
+        self._last_check = time.monotonic()
+
+    def _leak(self) -> None:
+        now = time.monotonic()
+        self._level = max(0.0, self._level - (now - self._last_check) * self._leak_rate)
+        self._last_check = now
+
+    async def acquire(self) -> None:
+        while True:
+            self._leak()
+            if self._level + 1 <= self.max_rate:
+                self._level += 1
+                return
+            await asyncio.sleep((self._level + 1 - self.max_rate) / self._leak_rate)
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_WHERE_OPERATORS = {"gte": ">=", "gt": ">", "lte": "<=", "lt": "<", "ne": "!=", "eq": "="}
+
+
+def _soql_literal(value: Any) -> str:
+    """Render a Python value as a SoQL literal."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _build_where(where: Dict[str, Any]) -> str:
+    """
+    Build a Socrata `$where` clause from a filter dict, ANDing every condition.
+
+    Keys are either a column name (equality) or `<column>_<op>` where op is one of
+    gte, gt, lte, lt, ne, eq. The special key `keywords` is a list of terms matched
+    case-insensitively (any term) against the columns in `keyword_fields`
+    (default ["title"]). None values are skipped.
+
+    Example: {"date_gte": "2025-01-01", "keywords": ["zoning", "budget"]} ->
+        "date >= '2025-01-01' AND (upper(title) LIKE '%ZONING%' OR upper(title) LIKE '%BUDGET%')"
+    """
+    clauses = []
+    keyword_fields = where.get("keyword_fields") or ["title"]
+    for key, value in where.items():
+        if value is None or key == "keyword_fields":
+            continue
+        if key == "keywords":
+            terms = [
+                f"upper({field}) LIKE " + _soql_literal(f"%{str(term).upper()}%")
+                for term in value
+                for field in keyword_fields
+            ]
+            if terms:
+                clauses.append("(" + " OR ".join(terms) + ")")
+            continue
+        column, _, op = key.rpartition("_")
+        if column and op in _WHERE_OPERATORS:
+            clauses.append(f"{column} {_WHERE_OPERATORS[op]} {_soql_literal(value)}")
+        else:
+            clauses.append(f"{key} = {_soql_literal(value)}")
+    return " AND ".join(clauses)
+
+
+def _soql_count_query(soql: str) -> Optional[str]:
+    """
+    Rewrite a SoQL query into `SELECT count(*) AS count WHERE ...`.
+    Returns None for grouped queries, where a row count cannot be derived this way.
+    """
+    if _SOQL_GROUPING_RE.search(soql):
+        return None
+    match = _SOQL_SELECT_RE.match(soql)
+    if not match:
+        return None
+    rest = _SOQL_ORDER_BY_RE.sub("", soql[match.end():]).strip()
+    return f"SELECT count(*) AS count {rest}".strip()
+
 
 class CivicAsyncClient:
     """
@@ -15,18 +203,36 @@ class CivicAsyncClient:
     - Use `fetch_socrata_paginated` for Socrata datasets with optional SoQL queries
       and app token support.
     - Supports async context manager and explicit close().
+    - Pass `client` to share an existing httpx.AsyncClient (and its connection pool);
+      a shared client is left open by close().
     """
 
-    def __init__(self, base_url: str = "https://data.cityofnewyork.us/resource/", timeout: float = 30.0):
+    def __init__(
+        self,
+        base_url: str = "https://data.cityofnewyork.us/resource/",
+        timeout: float = 30.0,
+        client: Optional[httpx.AsyncClient] = None
+    ):
         self.base_url = base_url.rstrip("/") + "/"
         self._timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[httpx.AsyncClient] = client
+        self._owns_client = client is None
 
     def _ensure_client(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(base_url=self.base_url, timeout=self._timeout)
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                limits=httpx.Limits(max_connections=MAX_CONNECTIONS),
+                headers=DEFAULT_HEADERS
+            )
         return self._client
 
+    def _url(self, endpoint: str) -> str:
+        """Resolve an endpoint against base_url (absolute URLs pass through)."""
+        if endpoint.startswith(("http://", "https://")):
+            return endpoint
+        return self.base_url + endpoint.lstrip("/")
+
     async def __aenter__(self):
         return self
 
@@ -34,6 +240,8 @@ class CivicAsyncClient:
         await self.close()
 
     async def close(self) -> None:
+        if not self._owns_client:
+            return
         if self._client:
             try:
                 await self._client.aclose()
@@ -42,15 +250,27 @@ class CivicAsyncClient:
             finally:
                 self._client = None
 
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """
+        Issue a GET on the pooled client and return the raw response (caller checks status).
+        """
+        client = self._ensure_client()
+        return await client.get(self._url(endpoint), params=params, headers=headers)
+
     async def fetch_paged_data(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Generic single-request fetch helper (returns parsed JSON or empty list).
         """
         client = self._ensure_client()
         try:
-            resp = await client.get(endpoint, params=params)
+            resp = await client.get(self._url(endpoint), params=params)
             resp.raise_for_status()
-            return resp.json()
+            return orjson.loads(resp.content)
         except httpx.HTTPStatusError as e:
             logger.error("HTTP error fetching %s: %s", endpoint, e)
             return []
@@ -64,7 +284,9 @@ class CivicAsyncClient:
         soql: Optional[str] = None,
         app_token: Optional[str] = None,
         limit: int = 1000,
-        max_pages: Optional[int] = None
+        max_pages: Optional[int] = None,
+        where: Optional[Dict[str, Any]] = None,
+        select: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Fetch all pages from a Socrata dataset resource with SoQL support.
@@ -76,8 +298,15 @@ class CivicAsyncClient:
             app_token: Optional Socrata app token to include as `X-App-Token` header.
             limit: Page size for `$limit` when paginating (default 1000).
             max_pages: Optional max number of pages to fetch (prevent runaway requests).
+            where: Optional filter dict sent as a server-side `$where` (see `_build_where`).
+                   Ignored when `soql` is given.
+            select: Optional `$select` column list to project only the needed fields.
+                    Ignored when `soql` is given.
         Returns:
             A list of result dicts (aggregated across pages).
+        Raises:
+            httpx.HTTPError: A page still failed after retries; a partial result
+                with a gap in the middle is never returned.
         """
         resource = resource.replace(".json", "")
         endpoint = f"{resource}.json"
@@ -87,67 +316,153 @@ class CivicAsyncClient:
         if app_token:
             headers["X-App-Token"] = app_token
 
-        results: List[Dict[str, Any]] = []
-
         # If a SoQL query is provided, prefer using $query for server-side filtering.
         if soql:
             # If the provided SoQL already contains LIMIT/OFFSET we don't paginate manually.
-            soql_upper = soql.upper()
-            has_limit = "LIMIT" in soql_upper
-            has_offset = "OFFSET" in soql_upper
-
-            if has_limit or has_offset:
+            if _soql_has_paging(soql):
                 params = {"$query": soql}
                 try:
-                    resp = await client.get(endpoint, params=params, headers=headers)
+                    resp = await client.get(self._url(endpoint), params=params, headers=headers)
                     resp.raise_for_status()
-                    return resp.json()
+                    return orjson.loads(resp.content)
                 except Exception as e:
                     logger.error("Socrata $query request failed: %s", e)
                     return []
 
             # No explicit LIMIT/OFFSET in SoQL — we'll paginate by appending LIMIT/OFFSET blocks.
-            offset = 0
-            page_count = 0
-            while True:
-                paged_query = f"{soql} LIMIT {limit} OFFSET {offset}"
-                params = {"$query": paged_query}
-                try:
-                    resp = await client.get(endpoint, params=params, headers=headers)
-                    resp.raise_for_status()
-                    page = resp.json()
-                except Exception as e:
-                    logger.error("Socrata paginated $query failed at offset %s: %s", offset, e)
-                    break
+            count_query = _soql_count_query(soql)
+            return await self._paginate(
+                endpoint,
+                headers,
+                page_params=lambda offset: {"$query": _soql_page_query(soql, limit, offset)},
+                count_params={"$query": count_query} if count_query else None,
+                limit=limit,
+                max_pages=max_pages
+            )
 
-                if not isinstance(page, list) or not page:
-                    break
+        # No soql: use $limit/$offset style pagination, filtering server-side via $where
+        page_params, count_params = _plain_page_params(limit, where, select)
+        return await self._paginate(
+            endpoint,
+            headers,
+            page_params=page_params,
+            count_params=count_params,
+            limit=limit,
+            max_pages=max_pages
+        )
 
-                results.extend(page)
-                page_count += 1
-                offset += limit
+    async def iter_socrata(
+        self,
+        resource: str,
+        soql: Optional[str] = None,
+        app_token: Optional[str] = None,
+        limit: int = 1000,
+        max_pages: Optional[int] = None,
+        where: Optional[Dict[str, Any]] = None,
+        select: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream rows from a Socrata dataset resource, one page at a time.
+
+        Same arguments and paging rules as `fetch_socrata_paginated`, but each
+        response body is parsed incrementally with ijson and rows are yielded as
+        they arrive, so resident memory stays O(page) rather than O(dataset).
+        Pages are fetched sequentially; use `fetch_socrata_paginated` when
+        throughput matters more than peak memory.
+        """
+        resource = resource.replace(".json", "")
+        endpoint = f"{resource}.json"
+
+        headers = {}
+        if app_token:
+            headers["X-App-Token"] = app_token
 
-                if max_pages and page_count >= max_pages:
-                    break
-                if len(page) < limit:
-                    break
+        if soql and _soql_has_paging(soql):
+            async for row in self._stream_rows(endpoint, headers, {"$query": soql}, 0):
+                yield row
+            return
 
-            return results
+        if soql:
+            page_params = lambda offset: {"$query": _soql_page_query(soql, limit, offset)}
+        else:
+            page_params, _ = _plain_page_params(limit, where, select)
 
-        # No soql: use $limit/$offset style pagination
         offset = 0
         page_count = 0
         while True:
-            params = {"$limit": limit, "$offset": offset}
-            try:
-                resp = await client.get(endpoint, params=params, headers=headers)
-                resp.raise_for_status()
-                page = resp.json()
-            except Exception as e:
-                logger.error("Socrata paginated request failed at offset %s: %s", offset, e)
+            rows = 0
+            async for row in self._stream_rows(endpoint, headers, page_params(offset), offset):
+                rows += 1
+                yield row
+            if not rows:
                 break
 
-            if not isinstance(page, list) or not page:
+            page_count += 1
+            offset += limit
+
+            if max_pages and page_count >= max_pages:
+                break
+            if rows < limit:
+                break
+
+    async def _stream_rows(
+        self,
+        endpoint: str,
+        headers: Dict[str, str],
+        params: Dict[str, Any],
+        offset: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream-parse the top-level JSON array of one response; errors end the stream."""
+        client = self._ensure_client()
+        try:
+            async with client.stream("GET", self._url(endpoint), params=params, headers=headers) as resp:
+                resp.raise_for_status()
+                async for row in ijson.items(_AsyncByteReader(resp), "item", use_float=True):
+                    yield row
+        except Exception as e:
+            logger.error("Socrata streamed request failed at offset %s: %s", offset, e)
+
+    async def _paginate(
+        self,
+        endpoint: str,
+        headers: Dict[str, str],
+        page_params: Callable[[int], Dict[str, Any]],
+        count_params: Optional[Dict[str, Any]],
+        limit: int,
+        max_pages: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch every page of a Socrata endpoint.
+
+        When the row count is available, all page offsets are requested concurrently
+        (bounded by the connection pool) and stitched back together in order.
+        Otherwise pages are walked one at a time until a short or empty page.
+        Page errors propagate (see `_fetch_page`).
+        """
+        total = await self._count_rows(endpoint, headers, count_params) if count_params else None
+
+        if total is not None:
+            if max_pages:
+                total = min(total, max_pages * limit)
+            offsets = range(0, total, limit)
+            semaphore = asyncio.Semaphore(MAX_CONNECTIONS)
+
+            async def fetch(offset: int) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    return await self._fetch_page(endpoint, headers, page_params(offset), offset)
+
+            pages = await asyncio.gather(*(fetch(offset) for offset in offsets))
+            results: List[Dict[str, Any]] = []
+            for page in pages:
+                results.extend(page)
+            return results
+
+        results = []
+        offset = 0
+        page_count = 0
+        while True:
+            page = await self._fetch_page(endpoint, headers, page_params(offset), offset)
+            if not page:
                 break
 
             results.extend(page)
@@ -159,4 +474,56 @@ class CivicAsyncClient:
             if len(page) < limit:
                 break
 
-        return results
\ No newline at end of file
+        return results
+
+    async def _count_rows(
+        self,
+        endpoint: str,
+        headers: Dict[str, str],
+        count_params: Dict[str, Any]
+    ) -> Optional[int]:
+        """Return the row count reported by a count(*) query, or None if unavailable."""
+        client = self._ensure_client()
+        try:
+            resp = await client.get(self._url(endpoint), params=count_params, headers=headers)
+            resp.raise_for_status()
+            return int(orjson.loads(resp.content)[0]["count"])
+        except Exception as e:
+            logger.debug("Socrata count query failed, paginating sequentially: %s", e)
+            return None
+
+    @retry(
+        stop=stop_after_attempt(PAGE_FETCH_ATTEMPTS),
+        wait=wait_exponential(multiplier=1, min=1, max=8),
+        retry=retry_if_exception(_is_retryable_http_error),
+        reraise=True
+    )
+    async def _fetch_page(
+        self,
+        endpoint: str,
+        headers: Dict[str, str],
+        params: Dict[str, Any],
+        offset: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch a single page, retrying transport errors, 429s and 5xx.
+
+        Anything that still fails is raised rather than returned as an empty
+        page, which the caller could not tell apart from the end of the data.
+        """
+        client = self._ensure_client()
+        try:
+            resp = await client.get(self._url(endpoint), params=params, headers=headers)
+            resp.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error("Socrata paginated request failed at offset %s: %s", offset, e)
+            raise
+        logger.debug(
+            "Socrata page at offset %s: content-encoding=%s",
+            offset, resp.headers.get("content-encoding", "identity")
+        )
+
+        page = orjson.loads(resp.content)
+        if not isinstance(page, list):
+            raise ValueError(f"Socrata page at offset {offset} is not a JSON array")
+        return page
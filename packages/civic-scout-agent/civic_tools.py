@@ -4,29 +4,40 @@ Core Function Tools for NYC Civic Scout Agent
 These tools represent the agent's available actions:
 1. get_legistar_events - DISCOVERY AGENT: Fetch events from NYC Legistar API
 2. geocode_address - GEOLOCATION TOOL: Convert addresses to coordinates
+   (batch_geocode - deduplicated concurrent variant)
 3. analyze_event_with_gemini - ANALYST AGENT: AI analysis of event impact
+   (analyze_events_batch - batched variant, one Gemini request per chunk)
 4. analyze_pdf_agenda - PDF READING TOOL: Extract and analyze PDF agendas
 """
 
 import os
-import json
+import re
+import asyncio
 import logging
 import hashlib
+import tempfile
+from functools import lru_cache
+from operator import itemgetter
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple, Any
+from typing import AsyncIterator, Iterable, List, Dict, Optional, Tuple, Any, Set
 
-import requests
 import httpx
-import googlemaps
+import orjson
+import ciso8601
+import diskcache
 import google.generativeai as genai
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from pydantic import ValidationError
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
 
-from models import LegistarEvent, GeminiAnalysisOutput, CivicEvent
-from AsyncClient import CivicAsyncClient
+from models import LegistarEvent, GeminiAnalysisOutput, CivicEvent, EventTopic
+from AsyncClient import CivicAsyncClient, AsyncRateLimiter, ACCEPT_ENCODING, HTTP2_AVAILABLE
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+# httpx logs full request URLs at INFO, which would include the geocoding API key
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
 # =============================================================================
 # Configuration and Constants
@@ -44,23 +55,164 @@ CIVIC_KEYWORDS = [
     'Sanitation', 'Parks', 'Affordable'
 ]
 
+# Single compiled alternation so keyword filtering is one case-insensitive scan per event;
+# longest keywords first so multi-word phrases win over any shorter overlapping entry
+CIVIC_KEYWORDS_RE = re.compile(
+    "|".join(map(re.escape, sorted(CIVIC_KEYWORDS, key=len, reverse=True))),
+    re.IGNORECASE
+)
+
+# Legistar fields scanned by the local keyword filter, pulled in one C-level call
+_EVENT_TEXT_KEYS = ("EventBodyName", "EventComment", "EventLocation")
+_EVENT_TEXT_DEFAULTS = dict.fromkeys(_EVENT_TEXT_KEYS, "")
+_event_text_fields = itemgetter(*_EVENT_TEXT_KEYS)
+
+# OData keyword clause so Legistar filters server-side and $top counts only relevant rows
+LEGISTAR_KEYWORD_FILTER = " or ".join(
+    f"substringof('{keyword.lower()}',tolower({field}))"
+    for keyword in CIVIC_KEYWORDS
+    for field in ("EventBodyName", "EventComment")
+)
+
+# Persistent on-disk caches for model and geocoding outputs (survive restarts)
+CACHE_DIR = os.getenv("CIVIC_CACHE_DIR", "./.civic_cache")
+ANALYSIS_CACHE_TTL = 7 * 86400  # seconds
+GEOCODE_CACHE_TTL = 30 * 86400  # seconds; geocodes rarely change
+GEOCODE_LRU_SIZE = 4096
+
+GOOGLE_GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+GEOCODE_CONCURRENCY = 10  # stay under the Geocoding API's per-second quota
+GEOCODE_RATE_LIMIT = (50, 1.0)  # (max requests, per this many seconds)
+
+GEMINI_RATE_LIMIT = (60, 60.0)  # (max requests, per this many seconds)
+
+GEMINI_MODEL_NAME = "gemini-2.5-flash"
+PDF_PROMPT_VERSION = "v1"
+PDF_STREAM_CHUNK_SIZE = 64 * 1024
+
+_disk_caches: Dict[str, diskcache.Cache] = {}
+
+# In-process LRU of normalized address -> (lat, lng), in front of the disk cache
+_geocode_lru: "OrderedDict[str, Tuple[Optional[float], Optional[float]]]" = OrderedDict()
+_geocode_semaphore = asyncio.Semaphore(GEOCODE_CONCURRENCY)
+
+# Geocode lookup counters (memory LRU hits, disk cache hits, API calls) for observability
+GEOCODE_STATS: Dict[str, int] = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+# Persistent analysis cache lookups (events settled by the keyword heuristic are not counted)
+ANALYSIS_STATS: Dict[str, int] = {"disk_hits": 0, "misses": 0}
+
+# Provider QPS limits, enforced client-side so fan-out waits instead of tripping 429s
+_geocode_limiter = AsyncRateLimiter(*GEOCODE_RATE_LIMIT)
+_gemini_limiter = AsyncRateLimiter(*GEMINI_RATE_LIMIT)
+
+# Single-flight map: analysis cache key -> future resolved by the caller doing the Gemini request
+_inflight_analyses: Dict[str, "asyncio.Future[Optional[GeminiAnalysisOutput]]"] = {}
+
+# Shared HTTP clients (lazily created, closed on app shutdown)
+_http_client: Optional[httpx.AsyncClient] = None
+_legistar_client: Optional[CivicAsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the module-wide pooled client. Legistar, Socrata, geocoding and PDF
+    downloads all share it, so each host keeps one warm set of TLS connections.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30),
+            # Accept stays per-request: this pool also downloads PDF agendas
+            headers={"Accept-Encoding": ACCEPT_ENCODING}
+        )
+    return _http_client
+
+
+def _get_disk_cache(name: str) -> diskcache.Cache:
+    """Return the named disk cache ("analysis", "geocode") under CACHE_DIR."""
+    cache = _disk_caches.get(name)
+    if cache is None:
+        cache = _disk_caches[name] = diskcache.Cache(os.path.join(CACHE_DIR, name))
+    return cache
+
+
+def _cache_get(name: str, key: str) -> Optional[Any]:
+    """Read from a disk cache, treating cache errors as misses."""
+    try:
+        return _get_disk_cache(name).get(key)
+    except Exception as e:
+        logger.debug(f"Disk cache '{name}' read failed: {e}")
+        return None
+
+
+def _cache_set(name: str, key: str, value: Any, expire: float) -> None:
+    """Write to a disk cache, ignoring cache errors."""
+    try:
+        _get_disk_cache(name).set(key, value, expire=expire)
+    except Exception as e:
+        logger.debug(f"Disk cache '{name}' write failed: {e}")
+
+
+def _cache_delete(name: str, key: str) -> None:
+    """Remove a disk cache entry, ignoring cache errors."""
+    try:
+        _get_disk_cache(name).delete(key)
+    except Exception as e:
+        logger.debug(f"Disk cache '{name}' delete failed: {e}")
+
+
+def _cached_analysis(cache_key: str, event_id: str) -> Optional[GeminiAnalysisOutput]:
+    """
+    Rebuild a cached analysis for event_id. Entries written under an older
+    schema or topic list no longer validate; they are deleted and read as misses.
+    """
+    cached = _cache_get("analysis", cache_key)
+    if cached is None:
+        return None
+    try:
+        return GeminiAnalysisOutput(**{**cached, "event_id": event_id})
+    except (ValidationError, TypeError) as e:
+        logger.info(f"Dropping stale analysis cache entry {cache_key}: {e}")
+        _cache_delete("analysis", cache_key)
+        return None
+
+
+def _get_legistar_client() -> CivicAsyncClient:
+    """Return the module-wide pooled client for the Legistar Web API."""
+    global _legistar_client
+    if _legistar_client is None:
+        _legistar_client = CivicAsyncClient(base_url=LEGISTAR_BASE_URL, client=get_http_client())
+    return _legistar_client
+
+
+async def close_http_clients() -> None:
+    """Close shared HTTP clients. Call from the application shutdown hook."""
+    global _http_client, _legistar_client
+    _legistar_client = None
+    if _http_client is not None:
+        try:
+            await _http_client.aclose()
+        except Exception as e:
+            logger.debug(f"Error closing HTTP client: {e}")
+        finally:
+            _http_client = None
+
 # =============================================================================
 # Analyst Agent System Prompt
 # =============================================================================
 
 SYSTEM_INSTRUCTION = """You are the 'Civic Scout Analyst Agent,' an unbiased, expert-level community advocate for underserved New York City neighborhoods. Your sole function is to process raw government meeting and event data, analyze its direct human impact, and generate a concise, actionable summary for public awareness. Output strictly in the requested JSON format."""
 
-ANALYSIS_PROMPT_TEMPLATE = """Analyze the following NYC government event and provide a structured assessment:
-
-EVENT DATA:
-- Event ID: {event_id}
+EVENT_DATA_TEMPLATE = """- Event ID: {event_id}
 - Title/Subject: {title}
 - Body/Committee: {body}
 - Date: {date}
 - Location: {location}
-- Additional Context: {context}
+- Additional Context: {context}"""
 
-INSTRUCTIONS - Perform multi-step reasoning:
+ANALYSIS_INSTRUCTIONS = """INSTRUCTIONS - Perform multi-step reasoning:
 
 1. CONTEXTUAL ANALYSIS (THOUGHT STEP):
    - Identify the core subject matter of this event
@@ -84,6 +236,19 @@ INSTRUCTIONS - Perform multi-step reasoning:
 4. TOPIC CLASSIFICATION:
    - Classify into one of these topics: "Legislation/Policy", "Zoning/Housing", "Budget/Finance", "Education", "Transportation", "Public Safety", "Health/Social Services", "Environment", "Other"
 
+"""
+
+# The analyst's system instruction carries every static part of the prompt (role,
+# reasoning steps, scoring rubric, topic taxonomy) so each request starts with the
+# same prefix and Gemini's implicit context caching can reuse it; only the
+# per-event data and the output shape follow in the request itself
+ANALYST_SYSTEM_INSTRUCTION = SYSTEM_INSTRUCTION + "\n\n" + ANALYSIS_INSTRUCTIONS.rstrip()
+
+ANALYSIS_PROMPT_TEMPLATE = """Analyze the following NYC government event and provide a structured assessment, following your INSTRUCTIONS:
+
+EVENT DATA:
+""" + EVENT_DATA_TEMPLATE + """
+
 Respond with a JSON object containing:
 - event_id: "{event_id}"
 - impact_score: (integer 1-5)
@@ -91,16 +256,137 @@ Respond with a JSON object containing:
 - topic: (one of the topic categories)
 """
 
+BATCH_ANALYSIS_PROMPT_TEMPLATE = """Analyze each of the following {count} NYC government events and provide a structured assessment for every one, following your INSTRUCTIONS:
+
+{events}
+
+Apply these steps to each event independently.
+
+Respond with a JSON array of {count} objects, one per event, in the same order. Each object contains:
+- event_id: (the Event ID given above)
+- impact_score: (integer 1-5)
+- community_impact_summary: (your 2-sentence summary)
+- topic: (one of the topic categories)
+"""
+
+# Keyword-classifier results at or above this confidence skip the Gemini call
+HEURISTIC_CONFIDENCE_THRESHOLD = 0.8
+HEURISTIC_MIN_TITLE_LENGTH = 20
+
+# Batches at least this large do their blocking prep (hashing, cache reads) off the event loop
+OFFLOAD_MIN_EVENTS = 50
+
+# Event fields that determine an analysis (and so its cache key)
+ANALYSIS_CONTENT_FIELDS = ("title", "body", "date", "location", "context")
+
+# Events per batched Gemini request (keeps prompts well inside the context window)
+ANALYSIS_BATCH_SIZE = 20
+
+# Socrata streaming pipeline: records buffered between fetch and transform,
+# and concurrent batch consumers
+SOCRATA_QUEUE_SIZE = 100
+SOCRATA_CONSUMERS = 4
+
+ANALYSIS_TOPICS = [topic.value for topic in EventTopic]
+
+# Label -> shared enum member; unknown labels from the model fall back to OTHER
+_TOPIC_BY_LABEL: Dict[str, EventTopic] = {topic.value: topic for topic in EventTopic}
+
+# Structured-output schema mirroring GeminiAnalysisOutput, so Gemini returns
+# parseable JSON with a valid topic instead of relying on prompt wording alone
+ANALYSIS_RESPONSE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "event_id": {"type": "STRING"},
+        "impact_score": {"type": "INTEGER"},
+        "community_impact_summary": {"type": "STRING"},
+        "topic": {"type": "STRING", "enum": ANALYSIS_TOPICS},
+    },
+    "required": ["event_id", "impact_score", "community_impact_summary", "topic"],
+}
+
+# JSON output at low temperature for consistent analyses; shared by every analysis request
+ANALYSIS_GENERATION_CONFIG = genai.GenerationConfig(
+    response_mime_type="application/json",
+    response_schema=ANALYSIS_RESPONSE_SCHEMA,
+    temperature=0.3
+)
+
+# Same settings for batched requests, constrained to one object per event
+BATCH_ANALYSIS_GENERATION_CONFIG = genai.GenerationConfig(
+    response_mime_type="application/json",
+    response_schema={"type": "ARRAY", "items": ANALYSIS_RESPONSE_SCHEMA},
+    temperature=0.3
+)
+
+
+@lru_cache(maxsize=1)
+def _configure_gemini(api_key: str) -> None:
+    """Configure the Gemini SDK once per API key."""
+    genai.configure(api_key=api_key)
+
+
+@lru_cache(maxsize=2)
+def _get_gemini_model(api_key: str, with_system_instruction: bool = True) -> genai.GenerativeModel:
+    """
+    Return the cached Gemini model: the Analyst Agent model (with ANALYST_SYSTEM_INSTRUCTION)
+    or a plain model for PDF extraction.
+    """
+    _configure_gemini(api_key)
+    if with_system_instruction:
+        return genai.GenerativeModel(
+            model_name=GEMINI_MODEL_NAME,
+            system_instruction=ANALYST_SYSTEM_INSTRUCTION
+        )
+    return genai.GenerativeModel(GEMINI_MODEL_NAME)
+
+
+def _event_prompt_fields(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill EVENT_DATA_TEMPLATE / ANALYSIS_PROMPT_TEMPLATE fields from an event dict."""
+    return {
+        "event_id": event["event_id"],
+        "title": event["title"],
+        "body": event.get("body", ""),
+        "date": event.get("date", ""),
+        "location": event.get("location", ""),
+        "context": event.get("context") or "No additional context available"
+    }
+
 # =============================================================================
 # Tool 1: DISCOVERY AGENT - Legistar Events Fetcher
 # =============================================================================
 
+@lru_cache(maxsize=1)
+def _legistar_headers() -> Dict[str, str]:
+    """
+    Request headers for the Legistar API, built once on first use
+    (after the app has loaded .env). Treat the returned dict as read-only.
+    """
+    headers = {
+        "Accept": "application/json",
+        "Content-Type": "application/json"
+    }
+    api_token = os.getenv("LEGISTAR_API_TOKEN")
+    if api_token:
+        headers["Authorization"] = f"Bearer {api_token}"
+    return headers
+
+
+def _is_retryable_http_error(exc: BaseException) -> bool:
+    """Retry transport failures, 429s and 5xx; other HTTP statuses won't improve on retry."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=2, max=10),
-    retry=retry_if_exception_type((requests.exceptions.RequestException, requests.exceptions.Timeout))
+    retry=retry_if_exception(_is_retryable_http_error),
+    reraise=True
 )
-def get_legistar_events(days_ahead: int = 30, filter_keywords: bool = True) -> List[Dict[str, Any]]:
+async def get_legistar_events(days_ahead: int = 30, filter_keywords: bool = True) -> List[Dict[str, Any]]:
     """
     DISCOVERY AGENT: Fetch current/future City Council Events from NYC Legistar API.
     
@@ -112,73 +398,61 @@ def get_legistar_events(days_ahead: int = 30, filter_keywords: bool = True) -> L
         List of raw event dictionaries from Legistar API
     
     Raises:
-        requests.exceptions.RequestException: If API call fails after retries
+        httpx.HTTPError: If API call fails after retries
     """
-    api_token = os.getenv("LEGISTAR_API_TOKEN", "")
-    
-    # Calculate date range
+    # Calculate date range and format it for the OData filter
     today = datetime.now()
-    future_date = today + timedelta(days=days_ahead)
+    today_str = f"{today:%Y-%m-%d}T00:00:00"
+    future_str = f"{today + timedelta(days=days_ahead):%Y-%m-%d}T23:59:59"
     
-    # Format dates for OData filter
-    today_str = today.strftime("%Y-%m-%dT00:00:00")
-    future_str = future_date.strftime("%Y-%m-%dT23:59:59")
-    
-    # Build OData filter query
-    odata_filter = f"EventDate ge datetime'{today_str}' and EventDate le datetime'{future_str}'"
+    # Build OData filter query; keyword matching is pushed to the server when enabled
+    date_filter = f"EventDate ge datetime'{today_str}' and EventDate le datetime'{future_str}'"
+    odata_filter = f"{date_filter} and ({LEGISTAR_KEYWORD_FILTER})" if filter_keywords else date_filter
     
     params = {
         "$filter": odata_filter,
         "$orderby": "EventDate asc",
         "$top": 100  # Limit results
     }
-    
-    headers = {
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-    
-    if api_token:
-        headers["Authorization"] = f"Bearer {api_token}"
+    headers = _legistar_headers()
     
     logger.info(f"Fetching Legistar events from {today_str} to {future_str}")
     
+    client = _get_legistar_client()
+    
     try:
-        response = requests.get(
-            LEGISTAR_EVENTS_ENDPOINT,
-            params=params,
-            headers=headers,
-            timeout=30
-        )
+        response = await client.get("Events", params=params, headers=headers)
+        
+        # Fall back to a date-only query with local filtering if the server rejects the keyword clause
+        filter_locally = filter_keywords and response.status_code == 400
+        if filter_locally:
+            logger.warning("Legistar rejected keyword $filter, falling back to client-side filtering")
+            params["$filter"] = date_filter
+            response = await client.get("Events", params=params, headers=headers)
         response.raise_for_status()
         
-        events = response.json()
-        logger.info(f"Retrieved {len(events)} raw events from Legistar")
+        events = orjson.loads(response.content)
+        logger.info(f"Retrieved {len(events)} events from Legistar")
         
-        # Filter by keywords if enabled
-        if filter_keywords and events:
-            filtered_events = []
-            for event in events:
-                event_text = " ".join([
-                    str(event.get("EventBodyName", "")),
-                    str(event.get("EventComment", "")),
-                    str(event.get("EventLocation", ""))
-                ]).lower()
-                
-                if any(keyword.lower() in event_text for keyword in CIVIC_KEYWORDS):
-                    filtered_events.append(event)
+        if filter_locally and events:
+            filtered_events = [
+                event for event in events
+                if CIVIC_KEYWORDS_RE.search(
+                    " ".join(map(str, _event_text_fields({**_EVENT_TEXT_DEFAULTS, **event})))
+                )
+            ]
             
             logger.info(f"Filtered to {len(filtered_events)} relevant civic events")
             return filtered_events
         
         return events
         
-    except requests.exceptions.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             logger.warning("Legistar API endpoint not found, returning empty list")
             return []
         raise
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Failed to fetch Legistar events: {e}")
         raise
 
@@ -187,6 +461,17 @@ def get_legistar_events(days_ahead: int = 30, filter_keywords: bool = True) -> L
 # Tool 2: GEOLOCATION TOOL - Google Maps Geocoding
 # =============================================================================
 
+# Approximate bounding boxes for NYC boroughs as (name, lat_min, lat_max, lng_min, lng_max),
+# checked in order. These are rough estimates and may have edge case inaccuracies
+BOROUGH_BOUNDS: Tuple[Tuple[str, float, float, float, float], ...] = (
+    ("Manhattan", 40.700, 40.882, -74.020, -73.907),
+    ("Brooklyn", 40.570, 40.739, -74.042, -73.833),
+    ("Queens", 40.541, 40.812, -73.962, -73.700),
+    ("Bronx", 40.785, 40.917, -73.933, -73.765),
+    ("Staten Island", 40.496, 40.651, -74.259, -74.052),
+)
+
+
 def get_borough_from_coordinates(lat: float, lng: float) -> Optional[str]:
     """
     Determine NYC borough from latitude/longitude coordinates.
@@ -195,19 +480,8 @@ def get_borough_from_coordinates(lat: float, lng: float) -> Optional[str]:
     Returns:
         Borough name or None if outside NYC
     """
-    # Approximate bounding boxes for NYC boroughs
-    # These are rough estimates and may have edge case inaccuracies
-    boroughs = {
-        "Manhattan": {"lat_min": 40.700, "lat_max": 40.882, "lng_min": -74.020, "lng_max": -73.907},
-        "Brooklyn": {"lat_min": 40.570, "lat_max": 40.739, "lng_min": -74.042, "lng_max": -73.833},
-        "Queens": {"lat_min": 40.541, "lat_max": 40.812, "lng_min": -73.962, "lng_max": -73.700},
-        "Bronx": {"lat_min": 40.785, "lat_max": 40.917, "lng_min": -73.933, "lng_max": -73.765},
-        "Staten Island": {"lat_min": 40.496, "lat_max": 40.651, "lng_min": -74.259, "lng_max": -74.052},
-    }
-    
-    for borough, bounds in boroughs.items():
-        if (bounds["lat_min"] <= lat <= bounds["lat_max"] and
-            bounds["lng_min"] <= lng <= bounds["lng_max"]):
+    for borough, lat_min, lat_max, lng_min, lng_max in BOROUGH_BOUNDS:
+        if lat_min <= lat <= lat_max and lng_min <= lng <= lng_max:
             return borough
     
     # Default to Manhattan for City Hall area addresses
@@ -217,32 +491,150 @@ def get_borough_from_coordinates(lat: float, lng: float) -> Optional[str]:
     return None
 
 
+# (group, borough, address fragments) in priority order: explicit borough names and
+# ZIP prefixes first, then well-known Manhattan landmarks
+_BOROUGH_ADDRESS_RULES = [
+    ("manhattan", "Manhattan", ["manhattan", "new york, ny 100"]),
+    ("brooklyn", "Brooklyn", ["brooklyn", "new york, ny 112"]),
+    ("queens", "Queens", ["queens", "new york, ny 11"]),
+    ("bronx", "Bronx", ["bronx", "new york, ny 104"]),
+    ("staten_island", "Staten Island", ["staten island", "new york, ny 103"]),
+    # City Hall and 250 Broadway are in Manhattan
+    ("landmark", "Manhattan", ["city hall", "250 broadway"]),
+]
+
+_BOROUGH_BY_GROUP = {group: borough for group, borough, _ in _BOROUGH_ADDRESS_RULES}
+_BOROUGH_PRIORITY = {group: rank for rank, (group, *_rest) in enumerate(_BOROUGH_ADDRESS_RULES)}
+BOROUGH_ADDRESS_RE = re.compile(
+    "|".join(
+        f"(?P<{group}>{'|'.join(map(re.escape, fragments))})"
+        for group, _, fragments in _BOROUGH_ADDRESS_RULES
+    ),
+    re.IGNORECASE
+)
+
+
 def get_borough_from_address(address: str) -> Optional[str]:
     """
     Try to extract borough from address string.
     """
-    address_lower = address.lower()
+    # Highest-priority rule with any fragment present in the address wins
+    matched = {m.lastgroup for m in BOROUGH_ADDRESS_RE.finditer(address)}
+    if not matched:
+        return None
+    return _BOROUGH_BY_GROUP[min(matched, key=_BOROUGH_PRIORITY.__getitem__)]
+
+
+# Unit designators ("Suite 200", "8th Floor", "Rm. 16") don't change the geocode,
+# so they are stripped to let e.g. every 250 Broadway hearing room share a cache entry.
+# Only a run of units ending a comma-separated segment is stripped, so venue names
+# that merely contain one ("Room 1 Bar") survive.
+_ADDRESS_UNIT = (
+    r"(?:\b(?:apt|apartment|suite|ste|unit|fl|floor|rm|(?:hearing\s+)?room)\b\.?\s*#?\s*\d\w*"
+    r"|\b\d+(?:st|nd|rd|th)\s+fl(?:oor)?\b\.?)"
+)
+_ADDRESS_UNIT_RE = re.compile(rf"\s*-?\s*{_ADDRESS_UNIT}(?:[\s\-]*{_ADDRESS_UNIT})*\s*$")
+
+# Punctuation that never changes a geocode ("St." vs "St", "#4" vs "4")
+_ADDRESS_PUNCTUATION_RE = re.compile(r"[.#;:'\"()]")
+
+
+def _normalize_address(address: str) -> str:
+    """
+    Normalize an address for geocoding and cache lookups: trim, lowercase,
+    drop trailing unit/floor/room designators, collapse whitespace and scope
+    to NYC when no city is given.
+    """
+    segments = [" ".join(segment.split()) for segment in address.lower().split(",")]
+    stripped = [_ADDRESS_UNIT_RE.sub("", segment) for segment in segments]
+    # A bare "Suite 200" has nothing else to geocode; keep it rather than collapse to the city
+    if any(stripped):
+        segments = stripped
+    normalized = ", ".join(segment for segment in segments if segment)
+    normalized = " ".join(_ADDRESS_PUNCTUATION_RE.sub("", normalized).split()).strip(" ,-")
+    if "new york" not in normalized:
+        normalized = f"{normalized}, new york city, ny"
+    return normalized
+
+
+class _GeocodeError(Exception):
+    """Geocoding API returned an error status (not cached)."""
+
+
+async def _geocode_cached(normalized_address: str, api_key: str) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Geocode a normalized address via the in-process LRU, the disk cache, then Google Maps.
     
-    # Check for explicit borough mentions
-    if "manhattan" in address_lower or "new york, ny 100" in address_lower:
-        return "Manhattan"
-    if "brooklyn" in address_lower or "new york, ny 112" in address_lower:
-        return "Brooklyn"
-    if "queens" in address_lower or "new york, ny 11" in address_lower:
-        return "Queens"
-    if "bronx" in address_lower or "new york, ny 104" in address_lower:
-        return "Bronx"
-    if "staten island" in address_lower or "new york, ny 103" in address_lower:
-        return "Staten Island"
+    API errors propagate so that failures are never cached; an empty result
+    set is cached as (None, None).
+    """
+    coords = _geocode_lru.get(normalized_address)
+    if coords is not None:
+        _geocode_lru.move_to_end(normalized_address)
+        GEOCODE_STATS["memory_hits"] += 1
+        return coords
+    
+    cached = _cache_get("geocode", normalized_address)
+    if cached is not None:
+        coords = tuple(cached)
+        GEOCODE_STATS["disk_hits"] += 1
+    else:
+        GEOCODE_STATS["misses"] += 1
+        async with _geocode_semaphore, _geocode_limiter:
+            response = await get_http_client().get(
+                GOOGLE_GEOCODE_URL,
+                params={"address": normalized_address, "key": api_key}
+            )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        status = data.get("status")
+        if status == "OK":
+            location = data["results"][0]["geometry"]["location"]
+            coords = (location["lat"], location["lng"])
+        elif status == "ZERO_RESULTS":
+            coords = (None, None)
+        else:
+            raise _GeocodeError(f"{status}: {data.get('error_message', '')}")
+        
+        _cache_set("geocode", normalized_address, coords, GEOCODE_CACHE_TTL)
     
-    # City Hall and 250 Broadway are in Manhattan
-    if "city hall" in address_lower or "250 broadway" in address_lower:
-        return "Manhattan"
+    _remember_geocode(normalized_address, coords)
+    return coords
+
+
+def _remember_geocode(normalized_address: str, coords: Tuple[Optional[float], Optional[float]]) -> None:
+    """Insert into the in-process LRU, evicting the least recently used entry."""
+    _geocode_lru[normalized_address] = coords
+    _geocode_lru.move_to_end(normalized_address)
+    if len(_geocode_lru) > GEOCODE_LRU_SIZE:
+        _geocode_lru.popitem(last=False)
+
+
+def warm_geocode_cache() -> int:
+    """
+    Preload the in-process geocode LRU from the disk cache (up to GEOCODE_LRU_SIZE
+    entries). Blocking; call from startup, e.g. via asyncio.to_thread.
     
-    return None
+    Returns:
+        Number of entries loaded
+    """
+    loaded = 0
+    try:
+        cache = _get_disk_cache("geocode")
+        for key in cache.iterkeys():
+            if loaded >= GEOCODE_LRU_SIZE:
+                break
+            coords = cache.get(key)
+            if coords is not None:
+                _geocode_lru.setdefault(key, tuple(coords))
+                loaded += 1
+    except Exception as e:
+        logger.debug(f"Geocode cache warm-up failed: {e}")
+    return loaded
 
 
-def geocode_address(address: str) -> Tuple[Optional[float], Optional[float], Optional[str]]:
+async def geocode_address(address: str) -> Tuple[Optional[float], Optional[float], Optional[str]]:
     """
     GEOLOCATION TOOL: Convert an address string to latitude/longitude coordinates.
     
@@ -251,6 +643,10 @@ def geocode_address(address: str) -> Tuple[Optional[float], Optional[float], Opt
     - Vague or invalid addresses
     - API errors
     
+    Requests go over the shared async HTTP client, at most GEOCODE_CONCURRENCY
+    at a time, so callers can gather many geocodes concurrently. Results are
+    cached in-process (LRU) and on disk, keyed by normalized address.
+    
     Args:
         address: The address string to geocode
     
@@ -270,16 +666,9 @@ def geocode_address(address: str) -> Tuple[Optional[float], Optional[float], Opt
         return (None, None, borough_from_text)
     
     try:
-        gmaps = googlemaps.Client(key=api_key)
-        
-        # Append NYC to improve geocoding accuracy
-        full_address = f"{address}, New York City, NY" if "new york" not in address.lower() else address
+        lat, lng = await _geocode_cached(_normalize_address(address), api_key)
         
-        geocode_result = gmaps.geocode(full_address)
-        
-        if geocode_result:
-            location = geocode_result[0]['geometry']['location']
-            lat, lng = location['lat'], location['lng']
+        if lat is not None and lng is not None:
             logger.debug(f"Geocoded '{address}' to ({lat}, {lng})")
             
             # Determine borough from coordinates or fall back to address text
@@ -290,7 +679,7 @@ def geocode_address(address: str) -> Tuple[Optional[float], Optional[float], Opt
             logger.warning(f"No geocoding results for address: {address}")
             return (None, None, borough_from_text)
             
-    except googlemaps.exceptions.ApiError as e:
+    except _GeocodeError as e:
         logger.error(f"Google Maps API error: {e}")
         return (None, None, borough_from_text)
     except Exception as e:
@@ -298,11 +687,42 @@ def geocode_address(address: str) -> Tuple[Optional[float], Optional[float], Opt
         return (None, None, borough_from_text)
 
 
+async def batch_geocode(
+    addresses: Iterable[str]
+) -> Dict[str, Tuple[Optional[float], Optional[float], Optional[str]]]:
+    """
+    Geocode many addresses in one pass, one request per distinct address.
+    
+    Duplicates are collapsed before any lookup, including spellings that only
+    differ in case, spacing, punctuation or unit designators, so each venue is
+    geocoded once. The distinct venues are gathered concurrently (still bounded
+    by GEOCODE_CONCURRENCY).
+    
+    Args:
+        addresses: Address strings, possibly repeated
+    
+    Returns:
+        Dict mapping each distinct address to its (latitude, longitude, borough)
+    """
+    # normalized address -> the spellings that share it
+    groups: Dict[str, List[str]] = {}
+    for address in dict.fromkeys(addresses):
+        key = _normalize_address(address) if address and address.strip() else address
+        groups.setdefault(key, []).append(address)
+    
+    results = await asyncio.gather(*(geocode_address(spellings[0]) for spellings in groups.values()))
+    return {
+        address: coords
+        for spellings, coords in zip(groups.values(), results)
+        for address in spellings
+    }
+
+
 # =============================================================================
 # Tool 3: ANALYST AGENT - Gemini Event Analysis
 # =============================================================================
 
-def analyze_event_with_gemini(
+async def analyze_event_with_gemini(
     event_id: str,
     title: str,
     body: str,
@@ -327,6 +747,8 @@ def analyze_event_with_gemini(
         location: Event location
         context: Additional context (agenda items, etc.)
     
+    Concurrent calls for the same prompt share a single Gemini request.
+    
     Returns:
         GeminiAnalysisOutput with impact_score, community_impact_summary, and topic
     """
@@ -335,53 +757,352 @@ def analyze_event_with_gemini(
         logger.warning("GEMINI_API_KEY not set, using default analysis")
         return _default_analysis(event_id, title)
     
+    # Clear-cut committee meetings don't need the model
+    heuristic, confidence = _heuristic_analysis(event_id, title, context)
+    if confidence >= HEURISTIC_CONFIDENCE_THRESHOLD:
+        logger.debug(f"Heuristic analysis used for event {event_id} (confidence {confidence})")
+        return heuristic
+    
+    # Format the analysis prompt
+    fields = _event_prompt_fields({
+        "event_id": event_id,
+        "title": title,
+        "body": body,
+        "date": date,
+        "location": location,
+        "context": context
+    })
+    prompt = ANALYSIS_PROMPT_TEMPLATE.format_map(fields)
+    
+    # Events with identical content reuse the stored analysis, whatever their ID
+    cache_key = _analysis_cache_key(fields)
+    cached = _cached_analysis(cache_key, event_id)
+    if cached is not None:
+        ANALYSIS_STATS["disk_hits"] += 1
+        logger.debug(f"Analysis cache hit for event {event_id}")
+        return cached
+    ANALYSIS_STATS["misses"] += 1
+    
+    # Another caller is already analyzing this content; wait for its result
+    inflight = _inflight_analyses.get(cache_key)
+    if inflight is not None:
+        logger.debug(f"Joining in-flight analysis for event {event_id}")
+        return _with_event_id(await asyncio.shield(inflight), event_id) or _default_analysis(event_id, title)
+    
+    future = _claim_inflight(cache_key)
+    try:
+        analysis = await _generate_analysis(api_key, prompt, event_id)
+        if analysis is not None:
+            _cache_set("analysis", cache_key, analysis.model_dump(), ANALYSIS_CACHE_TTL)
+        future.set_result(analysis)
+    finally:
+        _release_inflight(cache_key, future)
+    
+    return _with_event_id(analysis, event_id) or _default_analysis(event_id, title)
+
+
+async def _generate_analysis(api_key: str, prompt: str, event_id: str) -> Optional[GeminiAnalysisOutput]:
+    """Run one single-event Gemini request; returns None if the call or parsing fails."""
     try:
-        genai.configure(api_key=api_key)
-        
         # Use gemini-2.5-flash for best performance and quota availability
-        model = genai.GenerativeModel(
-            model_name='gemini-2.5-flash',
-            system_instruction=SYSTEM_INSTRUCTION
-        )
+        model = _get_gemini_model(api_key)
         
-        # Format the analysis prompt
-        prompt = ANALYSIS_PROMPT_TEMPLATE.format(
-            event_id=event_id,
-            title=title,
-            body=body,
-            date=date,
-            location=location,
-            context=context or "No additional context available"
-        )
-        
-        # Configure for JSON output
-        generation_config = genai.GenerationConfig(
-            response_mime_type="application/json",
-            temperature=0.3  # Lower temperature for more consistent analysis
-        )
-        
-        response = model.generate_content(
-            prompt,
-            generation_config=generation_config
-        )
+        async with _gemini_limiter:
+            response = await model.generate_content_async(
+                prompt,
+                generation_config=ANALYSIS_GENERATION_CONFIG
+            )
         
-        # Parse JSON response
-        result_text = response.text.strip()
-        result_data = json.loads(result_text)
+        # Parse JSON response (orjson skips surrounding whitespace itself)
+        result_data = orjson.loads(response.text)
         
         return GeminiAnalysisOutput(
             event_id=str(result_data.get("event_id", event_id)),
             impact_score=int(result_data.get("impact_score", 1)),
             community_impact_summary=result_data.get("community_impact_summary", ""),
-            topic=result_data.get("topic", "Other")
+            topic=_TOPIC_BY_LABEL.get(result_data.get("topic"), EventTopic.OTHER)
         )
         
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse Gemini JSON response: {e}")
-        return _default_analysis(event_id, title)
+        return None
     except Exception as e:
         logger.error(f"Gemini analysis failed: {e}")
-        return _default_analysis(event_id, title)
+        return None
+
+
+def _claim_inflight(cache_key: str) -> "asyncio.Future[Optional[GeminiAnalysisOutput]]":
+    """Register the current caller as the one performing the analysis for cache_key."""
+    future = asyncio.get_running_loop().create_future()
+    _inflight_analyses[cache_key] = future
+    return future
+
+
+def _release_inflight(cache_key: str, future: "asyncio.Future[Optional[GeminiAnalysisOutput]]") -> None:
+    """Drop the in-flight entry; waiters fall back to the default analysis if it never resolved."""
+    if not future.done():
+        future.set_result(None)
+    if _inflight_analyses.get(cache_key) is future:
+        del _inflight_analyses[cache_key]
+
+
+def _analysis_cache_key(fields: Dict[str, Any]) -> str:
+    """
+    Cache key for an event analysis: a hash of the model, prompts and the event's
+    content fields. The event ID is left out so re-listed events share an entry.
+    """
+    content = "\0".join(str(fields[key]) for key in ANALYSIS_CONTENT_FIELDS)
+    return "event:" + hashlib.sha256(
+        f"{GEMINI_MODEL_NAME}\0{ANALYST_SYSTEM_INSTRUCTION}\0{ANALYSIS_PROMPT_TEMPLATE}\0{content}".encode("utf-8")
+    ).hexdigest()
+
+
+def _with_event_id(
+    analysis: Optional[GeminiAnalysisOutput],
+    event_id: str
+) -> Optional[GeminiAnalysisOutput]:
+    """Re-label a shared (cached or in-flight) analysis with the caller's event ID."""
+    if analysis is None or analysis.event_id == event_id:
+        return analysis
+    return analysis.model_copy(update={"event_id": event_id})
+
+
+async def analyze_events_batch(events: List[Dict[str, Any]]) -> List[GeminiAnalysisOutput]:
+    """
+    ANALYST AGENT (batched): Analyze many events with one Gemini request per chunk.
+    
+    Cached analyses are served from disk and prompts already being analyzed by
+    another caller are awaited; only the remaining misses are sent to Gemini,
+    in chunks of ANALYSIS_BATCH_SIZE. Results share the per-event cache used by
+    analyze_event_with_gemini.
+    
+    Args:
+        events: Dicts with the analyze_event_with_gemini arguments
+                (event_id, title, body, date, location, context)
+    
+    Returns:
+        One GeminiAnalysisOutput per input event, in input order
+    """
+    if not events:
+        return []
+    
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        logger.warning("GEMINI_API_KEY not set, using default analysis")
+        return [_default_analysis(e["event_id"], e["title"]) for e in events]
+    
+    results: List[Optional[GeminiAnalysisOutput]] = [None] * len(events)
+    misses: List[Tuple[int, str]] = []
+    joined: List[Tuple[int, "asyncio.Future[Optional[GeminiAnalysisOutput]]"]] = []
+    # Later events whose content duplicates an earlier miss in this batch: index -> that miss's index
+    duplicates: Dict[int, int] = {}
+    miss_index: Dict[str, int] = {}
+    
+    # Classification, hashing and disk-cache reads are blocking work; large
+    # batches run them in a worker thread so the event loop keeps serving I/O
+    if len(events) >= OFFLOAD_MIN_EVENTS:
+        prepared = await asyncio.to_thread(_prepare_batch, events)
+    else:
+        prepared = _prepare_batch(events)
+    
+    heuristic_hits = 0
+    for i, (heuristic, cache_key, cached) in enumerate(prepared):
+        if heuristic is not None:
+            results[i] = heuristic
+            heuristic_hits += 1
+            continue
+        # Cache stats are applied here, on the event loop, not in the worker thread
+        ANALYSIS_STATS["disk_hits" if cached is not None else "misses"] += 1
+        if cached is not None:
+            results[i] = cached
+        elif cache_key in miss_index:
+            duplicates[i] = miss_index[cache_key]
+        elif cache_key in _inflight_analyses:
+            joined.append((i, _inflight_analyses[cache_key]))
+        else:
+            miss_index[cache_key] = i
+            misses.append((i, cache_key))
+    
+    if heuristic_hits:
+        logger.info(f"Batch analysis: {heuristic_hits}/{len(events)} events classified by keyword heuristic")
+    if misses:
+        logger.info(
+            f"Batch analysis: {len(events) - heuristic_hits - len(misses)} cached or in flight, "
+            f"{len(misses)} sent to Gemini"
+        )
+        futures = {cache_key: _claim_inflight(cache_key) for _, cache_key in misses}
+        try:
+            model = _get_gemini_model(api_key)
+            
+            for start in range(0, len(misses), ANALYSIS_BATCH_SIZE):
+                chunk = misses[start:start + ANALYSIS_BATCH_SIZE]
+                analyses = await _analyze_chunk(model, [events[i] for i, _ in chunk])
+                for (i, cache_key), analysis in zip(chunk, analyses):
+                    results[i] = analysis
+                    if analysis is not None:
+                        _cache_set("analysis", cache_key, analysis.model_dump(), ANALYSIS_CACHE_TTL)
+                    if not futures[cache_key].done():
+                        futures[cache_key].set_result(analysis)
+        finally:
+            for cache_key, future in futures.items():
+                _release_inflight(cache_key, future)
+    
+    for i, future in joined:
+        results[i] = _with_event_id(await asyncio.shield(future), events[i]["event_id"])
+    for i, first in duplicates.items():
+        results[i] = _with_event_id(results[first], events[i]["event_id"])
+    
+    return [
+        result or _default_analysis(event["event_id"], event["title"])
+        for result, event in zip(results, events)
+    ]
+
+
+def _prepare_batch(
+    events: List[Dict[str, Any]]
+) -> List[Tuple[Optional[GeminiAnalysisOutput], str, Optional[GeminiAnalysisOutput]]]:
+    """
+    Resolve what can be answered without Gemini, per event: a confident heuristic
+    analysis, else the cache key and any cached analysis (relabelled to the event).
+    Touches no event-loop or module state (the caller tallies ANALYSIS_STATS
+    from the result), so it is safe to run in a worker thread.
+    """
+    prepared = []
+    for event in events:
+        heuristic, confidence = _heuristic_analysis(event["event_id"], event["title"], event.get("context") or "")
+        if confidence >= HEURISTIC_CONFIDENCE_THRESHOLD:
+            prepared.append((heuristic, "", None))
+            continue
+        
+        cache_key = _analysis_cache_key(_event_prompt_fields(event))
+        prepared.append((None, cache_key, _cached_analysis(cache_key, event["event_id"])))
+    return prepared
+
+
+async def _analyze_chunk(
+    model: genai.GenerativeModel,
+    events: List[Dict[str, Any]]
+) -> List[Optional[GeminiAnalysisOutput]]:
+    """
+    Send one batched prompt and map the returned JSON array back onto the events.
+    Entries that are missing or malformed come back as None.
+    """
+    event_blocks = "\n\n".join(
+        f"EVENT {n}:\n" + EVENT_DATA_TEMPLATE.format_map(_event_prompt_fields(event))
+        for n, event in enumerate(events, start=1)
+    )
+    prompt = BATCH_ANALYSIS_PROMPT_TEMPLATE.format(count=len(events), events=event_blocks)
+    
+    try:
+        async with _gemini_limiter:
+            response = await model.generate_content_async(prompt, generation_config=BATCH_ANALYSIS_GENERATION_CONFIG)
+        result_data = orjson.loads(response.text)
+    except orjson.JSONDecodeError as e:
+        logger.error(f"Failed to parse Gemini batch JSON response: {e}")
+        return [None] * len(events)
+    except Exception as e:
+        logger.error(f"Gemini batch analysis failed: {e}")
+        return [None] * len(events)
+    
+    if isinstance(result_data, dict):
+        # Tolerate a wrapper object such as {"analyses": [...]}
+        result_data = next((v for v in result_data.values() if isinstance(v, list)), [])
+    if not isinstance(result_data, list):
+        return [None] * len(events)
+    
+    # Prefer matching on event_id; fall back to position
+    by_id = {
+        str(item.get("event_id")): item
+        for item in result_data if isinstance(item, dict)
+    }
+    analyses: List[Optional[GeminiAnalysisOutput]] = []
+    for n, event in enumerate(events):
+        event_id = str(event["event_id"])
+        item = by_id.get(event_id)
+        if item is None and n < len(result_data) and isinstance(result_data[n], dict):
+            item = result_data[n]
+        try:
+            analyses.append(GeminiAnalysisOutput(
+                event_id=event_id,
+                impact_score=int(item.get("impact_score", 1)),
+                community_impact_summary=item.get("community_impact_summary", ""),
+                topic=_TOPIC_BY_LABEL.get(item.get("topic"), EventTopic.OTHER)
+            ) if item else None)
+        except Exception as e:
+            logger.debug(f"Discarding malformed batch entry for event {event_id}: {e}")
+            analyses.append(None)
+    
+    return analyses
+
+
+# Fallback classifier: keyword groups in priority order -> (topic, score, summary)
+_DEFAULT_ANALYSIS_RULES = [
+    ("housing", [r'zon(?:e|es|ed|ing)', r'housing', r'land use'],
+     [r'(?<!economic )develop(?:ment|ments|ers?)', r'affordab(?:le|ility)'],
+     "Zoning/Housing", 4,
+     "This hearing will discuss zoning changes and housing development that could affect rent prices, building permits, and neighborhood character in your community."),
+    ("budget", [r'budget(?:s|ary)?', r'appropriations?', r'tax(?:es|ation)?', r'finances?'],
+     [r'financ(?:ial|ing)'],
+     "Budget/Finance", 4,
+     "Budget decisions made here directly impact funding for schools, parks, sanitation, and other essential services in your neighborhood."),
+    ("education", [r'schools?', r'education(?:al)?'],
+     [r'students?'],
+     "Education", 4,
+     "This meeting addresses school policies, funding, and programs that affect students and families throughout NYC public schools."),
+    ("safety", [r'police', r'fires?', r'emergenc(?:y|ies)'],
+     [r'safety'],
+     "Public Safety", 3,
+     "Public safety policies discussed here may change how police and emergency services operate in your neighborhood."),
+    ("transportation", [r'transit', r'transportation', r'mta'],
+     [r'traffic'],
+     "Transportation", 3,
+     "Transportation decisions here could affect subway service, bus routes, bike lanes, and street safety in your area."),
+    ("health", [r'health', r'healthcare', r'hospitals?', r'social services?', r'mental health'],
+     [r'disabilit(?:y|ies)', r'addictions?'],
+     "Health/Social Services", 4,
+     "This committee discusses healthcare access, mental health services, and social programs that support vulnerable New Yorkers."),
+    ("immigration", [r'immigra(?:tion|nts?)'],
+     [],
+     "Legislation/Policy", 4,
+     "Immigration policy decisions here affect services, protections, and resources available to immigrant communities across NYC."),
+    ("parks", [r'parks'],
+     [r'recreation(?:al)?'],
+     "Legislation/Policy", 3,
+     "Parks committee decisions impact green space maintenance, recreation programs, and public facilities in your neighborhood."),
+    ("veterans", [r'veterans?'],
+     [],
+     "Legislation/Policy", 3,
+     "This meeting addresses services, benefits, and support programs specifically for NYC's veteran community."),
+]
+
+DEFAULT_ANALYSIS_TABLE: Dict[str, Tuple[EventTopic, int, str]] = {
+    name: (_TOPIC_BY_LABEL[topic], score, summary) for name, _, _, topic, score, summary in _DEFAULT_ANALYSIS_RULES
+}
+DEFAULT_ANALYSIS_TABLE["other"] = (
+    EventTopic.LEGISLATION_POLICY, 2,
+    "This council meeting will discuss citywide policies and legislation that may have broad impacts on NYC residents."
+)
+
+# One named group per rule for its distinctive keywords, plus a "<rule>_broad"
+# group for keywords that also show up in unrelated titles ("Economic
+# Development", "Public Safety"); a single scan collects every matching group.
+# Keywords are regex stems listing their inflections ("tax(?:es|ation)?") and
+# must match whole words, so e.g. "Taxi" is not read as "tax".
+_DEFAULT_ANALYSIS_PRIORITY = {name: rank for rank, (name, *_rest) in enumerate(_DEFAULT_ANALYSIS_RULES)}
+_DEFAULT_ANALYSIS_GROUPS = {
+    group: name
+    for name, *_rest in _DEFAULT_ANALYSIS_RULES
+    for group in (name, f"{name}_broad")
+}
+DEFAULT_ANALYSIS_RE = re.compile(
+    "|".join(
+        rf"(?P<{group}>\b(?:{'|'.join(keywords)})\b)"
+        for name, words, broad_words, *_rest in _DEFAULT_ANALYSIS_RULES
+        for group, keywords in ((name, words), (f"{name}_broad", broad_words))
+        if keywords
+    ),
+    re.IGNORECASE
+)
 
 
 def _default_analysis(event_id: str, title: str) -> GeminiAnalysisOutput:
@@ -389,72 +1110,106 @@ def _default_analysis(event_id: str, title: str) -> GeminiAnalysisOutput:
     Enhanced fallback analysis when Gemini is unavailable.
     Provides contextual summaries based on committee type.
     """
-    title_lower = title.lower()
-    
-    # Enhanced keyword-based classification with contextual summaries
-    if any(word in title_lower for word in ['zoning', 'housing', 'land use', 'development', 'affordable']):
-        topic = "Zoning/Housing"
-        score = 4
-        summary = "This hearing will discuss zoning changes and housing development that could affect rent prices, building permits, and neighborhood character in your community."
-    elif any(word in title_lower for word in ['budget', 'appropriation', 'tax', 'finance']):
-        topic = "Budget/Finance"
-        score = 4
-        summary = "Budget decisions made here directly impact funding for schools, parks, sanitation, and other essential services in your neighborhood."
-    elif any(word in title_lower for word in ['school', 'education', 'student']):
-        topic = "Education"
-        score = 4
-        summary = "This meeting addresses school policies, funding, and programs that affect students and families throughout NYC public schools."
-    elif any(word in title_lower for word in ['police', 'safety', 'fire', 'emergency']):
-        topic = "Public Safety"
-        score = 3
-        summary = "Public safety policies discussed here may change how police and emergency services operate in your neighborhood."
-    elif any(word in title_lower for word in ['transit', 'transportation', 'mta', 'traffic']):
-        topic = "Transportation"
-        score = 3
-        summary = "Transportation decisions here could affect subway service, bus routes, bike lanes, and street safety in your area."
-    elif any(word in title_lower for word in ['health', 'hospital', 'social service', 'mental health', 'disabilities', 'addiction']):
-        topic = "Health/Social Services"
-        score = 4
-        summary = "This committee discusses healthcare access, mental health services, and social programs that support vulnerable New Yorkers."
-    elif any(word in title_lower for word in ['immigration', 'immigrant']):
-        topic = "Legislation/Policy"
-        score = 4
-        summary = "Immigration policy decisions here affect services, protections, and resources available to immigrant communities across NYC."
-    elif any(word in title_lower for word in ['parks', 'recreation']):
-        topic = "Legislation/Policy"
-        score = 3
-        summary = "Parks committee decisions impact green space maintenance, recreation programs, and public facilities in your neighborhood."
-    elif any(word in title_lower for word in ['veterans']):
-        topic = "Legislation/Policy"
-        score = 3
-        summary = "This meeting addresses services, benefits, and support programs specifically for NYC's veteran community."
+    return _heuristic_analysis(event_id, title)[0]
+
+
+def _heuristic_analysis(event_id: str, title: str, context: str = "") -> Tuple[GeminiAnalysisOutput, float]:
+    """
+    Keyword-classify an event and rate how far the result can be trusted (0-1).
+    
+    Confidence is high only when exactly one rule matches, through at least
+    one of its distinctive keywords, a reasonably descriptive title and there
+    is no extra context (e.g. a PDF agenda summary) that Gemini could use to
+    do better.
+    """
+    # Highest-priority rule with any keyword present in the title wins
+    groups = {m.lastgroup for m in DEFAULT_ANALYSIS_RE.finditer(title)}
+    matched = {_DEFAULT_ANALYSIS_GROUPS[group] for group in groups}
+    rule = min(matched, key=_DEFAULT_ANALYSIS_PRIORITY.__getitem__) if matched else "other"
+    topic, score, summary = DEFAULT_ANALYSIS_TABLE[rule]
+    
+    if len(matched) == 1 and rule in groups:
+        confidence = 0.9
+    elif matched:
+        confidence = 0.6  # several committees' keywords, or only broad ones; the pick may be wrong
     else:
-        topic = "Legislation/Policy"
-        score = 2
-        summary = "This council meeting will discuss citywide policies and legislation that may have broad impacts on NYC residents."
+        confidence = 0.0
+    if len(title) < HEURISTIC_MIN_TITLE_LENGTH or context:
+        confidence = min(confidence, 0.5)
     
-    return GeminiAnalysisOutput(
+    analysis = GeminiAnalysisOutput(
         event_id=event_id,
         impact_score=score,
         community_impact_summary=summary,
         topic=topic
     )
+    return analysis, confidence
 
 
 # =============================================================================
 # Tool 4: PDF READING TOOL - Agenda Analysis
 # =============================================================================
 
-async def analyze_pdf_agenda(pdf_url: str, event_id: str) -> Optional[str]:
+async def _download_pdf(
+    pdf_url: str,
+    headers: Dict[str, str]
+) -> Tuple[Optional[str], Optional[str], httpx.Headers]:
+    """
+    Stream a PDF to a temporary file over the pooled keep-alive client, hashing
+    as it arrives so the whole document is never held in memory.
+    
+    Returns:
+        (temp file path, sha256 hex digest, response headers); path and digest
+        are None when a conditional request came back 304 Not Modified
+    """
+    digest = hashlib.sha256()
+    async with get_http_client().stream("GET", pdf_url, headers=headers) as response:
+        if response.status_code == 304:
+            return None, None, response.headers
+        response.raise_for_status()
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+            try:
+                async for chunk in response.aiter_bytes(PDF_STREAM_CHUNK_SIZE):
+                    tmp.write(chunk)
+                    digest.update(chunk)
+            except BaseException:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+        return tmp.name, digest.hexdigest(), response.headers
+
+
+def _remember_pdf_validators(url_key: str, cache_key: str, headers: httpx.Headers) -> None:
+    """Store the URL's ETag/Last-Modified so the next run can send a conditional GET."""
+    etag = headers.get("etag")
+    last_modified = headers.get("last-modified")
+    if etag or last_modified:
+        _cache_set(
+            "analysis", url_key,
+            {"cache_key": cache_key, "etag": etag, "last_modified": last_modified},
+            ANALYSIS_CACHE_TTL
+        )
+
+
+async def analyze_pdf_agenda(
+    pdf_url: str,
+    event_id: str,
+    published: Optional[str] = None
+) -> Optional[str]:
     """
     PDF READING TOOL: Download and analyze PDF agenda using Gemini.
     
-    Uses Gemini's File API to upload PDF and extract key information
-    relevant to community impact.
+    Streams the PDF to a temporary file, uploads it with Gemini's File API
+    and extracts key information relevant to community impact. Summaries are
+    cached by content hash; a URL seen before is revalidated with a
+    conditional GET so unchanged agendas are not downloaded again. When the
+    agenda's publish timestamp is known, a summary stored for the same URL and
+    timestamp is returned without touching the network at all.
     
     Args:
         pdf_url: URL to the PDF agenda file
         event_id: Event ID for reference
+        published: Legistar EventAgendaLastPublishedUTC; bumped on republish
     
     Returns:
         Extracted context string from the PDF, or None if analysis fails
@@ -467,26 +1222,55 @@ async def analyze_pdf_agenda(pdf_url: str, event_id: str) -> Optional[str]:
     if not pdf_url:
         return None
     
+    # Published agendas are immutable until Legistar bumps the timestamp
+    published_key = f"pdf-published:{PDF_PROMPT_VERSION}:{pdf_url}|{published}" if published else None
+    if published_key:
+        summary = _cache_get("analysis", published_key)
+        if summary is not None:
+            logger.debug(f"PDF agenda unchanged since {published} for event {event_id}")
+            return summary
+    
+    summary = await _summarize_pdf_agenda(api_key, pdf_url, event_id)
+    if summary is not None and published_key:
+        _cache_set("analysis", published_key, summary, ANALYSIS_CACHE_TTL)
+    return summary
+
+
+async def _summarize_pdf_agenda(api_key: str, pdf_url: str, event_id: str) -> Optional[str]:
+    """Download (conditionally) and summarize one agenda; see analyze_pdf_agenda."""
+    # If this URL was analyzed before, revalidate it instead of re-downloading
+    url_key = f"pdf-url:{PDF_PROMPT_VERSION}:{pdf_url}"
+    validators = _cache_get("analysis", url_key)
+    previous = _cache_get("analysis", validators["cache_key"]) if validators else None
+    conditional_headers = {}
+    if previous is not None:
+        if validators.get("etag"):
+            conditional_headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            conditional_headers["If-Modified-Since"] = validators["last_modified"]
+    
+    pdf_path: Optional[str] = None
+    pdf_file = None
     try:
-        # Download PDF content
-        async with httpx.AsyncClient() as client:
-            response = await client.get(pdf_url, timeout=30.0)
-            response.raise_for_status()
-            pdf_content = response.content
+        pdf_path, digest, response_headers = await _download_pdf(pdf_url, conditional_headers)
+        if pdf_path is None:
+            logger.debug(f"PDF agenda unchanged (304) for event {event_id}")
+            return previous
         
-        genai.configure(api_key=api_key)
+        # Re-downloaded agendas with unchanged bytes reuse the stored summary
+        cache_key = f"pdf:{PDF_PROMPT_VERSION}:{digest}"
+        _remember_pdf_validators(url_key, cache_key, response_headers)
+        cached = _cache_get("analysis", cache_key)
+        if cached is not None:
+            logger.debug(f"PDF analysis cache hit for event {event_id}")
+            return cached
         
-        # Upload PDF to Gemini File API
-        # Note: For production, you'd use the actual File API upload
-        # Here we'll use inline data for PDFs under 20MB
+        model = _get_gemini_model(api_key, with_system_instruction=False)
         
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        
-        # Create a file-like part for the PDF
-        pdf_part = {
-            "mime_type": "application/pdf",
-            "data": pdf_content
-        }
+        # Upload PDF to the Gemini File API (blocking SDK call, so off the event loop)
+        pdf_file = await asyncio.to_thread(
+            genai.upload_file, pdf_path, mime_type="application/pdf"
+        )
         
         prompt = """Extract the key agenda items from this PDF document.
         Focus on items that would affect residents:
@@ -498,9 +1282,14 @@ async def analyze_pdf_agenda(pdf_url: str, event_id: str) -> Optional[str]:
         
         Provide a brief summary (2-3 sentences) of the most impactful items."""
         
-        response = model.generate_content([prompt, pdf_part])
+        # Async SDK call so concurrent agenda analyses don't stall the event loop
+        async with _gemini_limiter:
+            response = await model.generate_content_async([prompt, pdf_file])
+        
+        summary = response.text.strip()
+        _cache_set("analysis", cache_key, summary, ANALYSIS_CACHE_TTL)
         
-        return response.text.strip()
+        return summary
         
     except httpx.HTTPError as e:
         logger.error(f"Failed to download PDF from {pdf_url}: {e}")
@@ -508,16 +1297,44 @@ async def analyze_pdf_agenda(pdf_url: str, event_id: str) -> Optional[str]:
     except Exception as e:
         logger.error(f"PDF analysis failed: {e}")
         return None
+    finally:
+        if pdf_file is not None:
+            # Uploaded files otherwise linger in the project's File API quota
+            try:
+                await asyncio.to_thread(genai.delete_file, pdf_file.name)
+            except Exception as e:
+                logger.warning(f"Failed to delete uploaded PDF {pdf_file.name}: {e}")
+        if pdf_path:
+            try:
+                os.unlink(pdf_path)
+            except OSError:
+                pass
 
 
 # =============================================================================
 # Utility Functions
 # =============================================================================
 
+@lru_cache(maxsize=4096)
+def parse_event_date(event_date: str) -> Optional[datetime]:
+    """
+    Parse a Legistar EventDate, or return None if it is missing or malformed.
+    Memoized: a calendar repeats the same handful of dates many times.
+    """
+    if not event_date:
+        return None
+    try:
+        # C parser; handles a trailing "Z" natively
+        return ciso8601.parse_datetime(event_date)
+    except ValueError:
+        return None
+
+
 def transform_legistar_to_civic_event(
     raw_event: Dict[str, Any],
     analysis: GeminiAnalysisOutput,
-    coordinates: Tuple[Optional[float], Optional[float], Optional[str]]
+    coordinates: Tuple[Optional[float], Optional[float], Optional[str]],
+    event_date: Optional[datetime] = None
 ) -> CivicEvent:
     """
     Transform raw Legistar event data into a CivicEvent model.
@@ -526,25 +1343,22 @@ def transform_legistar_to_civic_event(
         raw_event: Raw event dictionary from Legistar API
         analysis: Gemini analysis output
         coordinates: Tuple of (latitude, longitude, borough)
+        event_date: EventDate already parsed by the caller (parsed here if omitted)
     
     Returns:
         Fully populated CivicEvent model
     """
-    # Parse and format date/time
-    event_date = raw_event.get("EventDate", "")
+    # Format date/time straight from the parsed date; no string round trip
+    raw_date = raw_event.get("EventDate", "")
     event_time = raw_event.get("EventTime", "")
-    
-    if event_date:
-        try:
-            # Parse ISO date format
-            dt = datetime.fromisoformat(event_date.replace("Z", "+00:00"))
-            if event_time:
-                # Combine with time if available
-                date_time = f"{dt.strftime('%Y-%m-%d')}T{event_time}"
-            else:
-                date_time = dt.isoformat()
-        except ValueError:
-            date_time = event_date
+    if event_date is None:
+        event_date = parse_event_date(raw_date)
+    
+    if event_date is not None:
+        # Combine with time if available
+        date_time = f"{event_date:%Y-%m-%d}T{event_time}" if event_time else event_date.isoformat()
+    elif raw_date:
+        date_time = raw_date
     else:
         date_time = datetime.now().isoformat()
     
@@ -576,7 +1390,9 @@ async def get_socrata_dataset_async(
     soql: Optional[str] = None,
     app_token: Optional[str] = None,
     limit: int = 1000,
-    max_pages: Optional[int] = None
+    max_pages: Optional[int] = None,
+    where: Optional[Dict[str, Any]] = None,
+    select: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """
     Async fetch for a Socrata dataset using CivicAsyncClient.
@@ -587,36 +1403,73 @@ async def get_socrata_dataset_async(
         app_token: Optional app token (uses NYC_OPEN_DATA_TOKEN env var if not provided)
         limit: Page size for pagination (default: 1000)
         max_pages: Max pages to fetch (prevents runaway requests)
+        where: Optional filter dict pushed server-side as `$where`
+               (e.g. {"date_gte": "2025-01-01", "keywords": ["zoning"]}); ignored with soql
+        select: Optional `$select` column list to project only needed fields; ignored with soql
     
     Returns:
         List of raw records from the dataset
     """
     base_url = os.getenv("SOCRATA_BASE_URL", "https://data.cityofnewyork.us/resource/")
-    async with CivicAsyncClient(base_url=base_url) as client:
+    async with CivicAsyncClient(base_url=base_url, client=get_http_client()) as client:
         results = await client.fetch_socrata_paginated(
             resource=dataset_id,
             soql=soql,
             app_token=app_token or os.getenv("NYC_OPEN_DATA_TOKEN"),
             limit=limit,
-            max_pages=max_pages
+            max_pages=max_pages,
+            where=where,
+            select=select
         )
         return results or []
 
 
-async def transform_socrata_to_civic_event(raw: Dict[str, Any]) -> CivicEvent:
+async def iter_socrata_dataset_async(
+    dataset_id: str,
+    soql: Optional[str] = None,
+    app_token: Optional[str] = None,
+    limit: int = 1000,
+    max_pages: Optional[int] = None,
+    where: Optional[Dict[str, Any]] = None,
+    select: Optional[str] = None
+) -> AsyncIterator[Dict[str, Any]]:
     """
-    Convert a Socrata record to CivicEvent.
-    
-    Uses heuristic field mapping for common Socrata schemas.
-    Performs geocoding and AI analysis using existing tools.
+    Streaming counterpart of get_socrata_dataset_async.
     
-    Args:
-        raw: Raw Socrata record dictionary
-    
-    Returns:
-        Transformed CivicEvent object
+    Yields raw records as they are parsed so large datasets never have to be
+    held in memory at once. Arguments match get_socrata_dataset_async.
+    """
+    base_url = os.getenv("SOCRATA_BASE_URL", "https://data.cityofnewyork.us/resource/")
+    async with CivicAsyncClient(base_url=base_url, client=get_http_client()) as client:
+        async for record in client.iter_socrata(
+            resource=dataset_id,
+            soql=soql,
+            app_token=app_token or os.getenv("NYC_OPEN_DATA_TOKEN"),
+            limit=limit,
+            max_pages=max_pages,
+            where=where,
+            select=select
+        ):
+            yield record
+
+
+def _socrata_location(raw: Dict[str, Any]) -> str:
+    """Location string of a Socrata record, trying common schema fields."""
+    return (
+        raw.get("location_name") or 
+        raw.get("location") or 
+        raw.get("address") or 
+        raw.get("park_address") or
+        raw.get("eventlocation") or
+        "New York, NY"
+    )
+
+
+def _socrata_fields(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map a Socrata record onto CivicEvent-ready fields, using heuristic
+    fallbacks for common Socrata schemas.
     """
-    # Extract fields with fallbacks for common Socrata schemas
     event_id_raw = (
         raw.get("objectid") or 
         raw.get("id") or 
@@ -645,14 +1498,7 @@ async def transform_socrata_to_civic_event(raw: Dict[str, Any]) -> CivicEvent:
         datetime.now().isoformat()
     )
     
-    location = (
-        raw.get("location_name") or 
-        raw.get("location") or 
-        raw.get("address") or 
-        raw.get("park_address") or
-        raw.get("eventlocation") or
-        "New York, NY"
-    )
+    location = _socrata_location(raw)
     
     link = raw.get("url") or raw.get("link") or raw.get("eventurl") or ""
     
@@ -670,25 +1516,40 @@ async def transform_socrata_to_civic_event(raw: Dict[str, Any]) -> CivicEvent:
     else:
         event_id = f"socrata-{event_id_raw}"
     
-    # Perform analysis using existing Gemini tool
-    analysis = analyze_event_with_gemini(
-        event_id=event_id,
-        title=title,
-        body=description[:200],  # Truncate for context
-        date=str(date_time),
-        location=location,
-        context=description
-    )
-    
-    # Geocode address using existing tool
-    coords = geocode_address(location)
-    
+    return {
+        "event_id": event_id,
+        "title": title,
+        "date_time": str(date_time),
+        "location": location,
+        "link": link,
+        "description": description
+    }
+
+
+def _socrata_analysis_input(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """analyze_event_with_gemini / analyze_events_batch arguments for a Socrata record."""
+    return {
+        "event_id": fields["event_id"],
+        "title": fields["title"],
+        "body": fields["description"][:200],  # Truncate for context
+        "date": fields["date_time"],
+        "location": fields["location"],
+        "context": fields["description"]
+    }
+
+
+def _build_socrata_civic_event(
+    fields: Dict[str, Any],
+    analysis: GeminiAnalysisOutput,
+    coords: Tuple[Optional[float], Optional[float], Optional[str]]
+) -> CivicEvent:
+    """Assemble a CivicEvent from extracted Socrata fields, analysis and coordinates."""
     return CivicEvent(
-        id=event_id,
-        title=title,
-        date_time=str(date_time),
-        location=location,
-        link=link,
+        id=fields["event_id"],
+        title=fields["title"],
+        date_time=fields["date_time"],
+        location=fields["location"],
+        link=fields["link"],
         topic=analysis.topic,
         impact_score=analysis.impact_score,
         community_impact_summary=analysis.community_impact_summary,
@@ -698,6 +1559,62 @@ async def transform_socrata_to_civic_event(raw: Dict[str, Any]) -> CivicEvent:
     )
 
 
+async def transform_socrata_to_civic_event(
+    raw: Dict[str, Any],
+    coord_map: Optional[Dict[str, Tuple[Optional[float], Optional[float], Optional[str]]]] = None
+) -> CivicEvent:
+    """
+    Convert a Socrata record to CivicEvent.
+    
+    Uses heuristic field mapping for common Socrata schemas.
+    Performs geocoding and AI analysis using existing tools. For many records,
+    get_socrata_parks_events batches both steps instead.
+    
+    Args:
+        raw: Raw Socrata record dictionary
+        coord_map: Optional batch_geocode result; the record's location is
+            geocoded inline only when it is missing from the map
+    
+    Returns:
+        Transformed CivicEvent object
+    """
+    fields = _socrata_fields(raw)
+    
+    # Perform analysis using existing Gemini tool
+    analysis = await analyze_event_with_gemini(**_socrata_analysis_input(fields))
+    
+    # Geocode address using existing tool, unless it was batch-geocoded up front
+    coords = coord_map.get(fields["location"]) if coord_map else None
+    if coords is None:
+        coords = await geocode_address(fields["location"])
+    
+    return _build_socrata_civic_event(fields, analysis, coords)
+
+
+async def _transform_socrata_batch(
+    batch: List[Tuple[int, Dict[str, Any]]]
+) -> List[Tuple[int, CivicEvent]]:
+    """
+    Geocode and analyze a batch of extracted Socrata records concurrently
+    (one batched Gemini request), keeping each record's position.
+    """
+    records = [fields for _, fields in batch]
+    coord_map, analyses = await asyncio.gather(
+        batch_geocode(fields["location"] for fields in records),
+        analyze_events_batch([_socrata_analysis_input(fields) for fields in records])
+    )
+    
+    transformed: List[Tuple[int, CivicEvent]] = []
+    for (index, fields), analysis in zip(batch, analyses):
+        try:
+            transformed.append(
+                (index, _build_socrata_civic_event(fields, analysis, coord_map[fields["location"]]))
+            )
+        except Exception as e:
+            logger.debug(f"Failed to transform Socrata record: {e}")
+    return transformed
+
+
 async def get_socrata_parks_events(
     days_ahead: int = 30, 
     limit: int = 200,
@@ -707,7 +1624,7 @@ async def get_socrata_parks_events(
     Fetch parks-related events from NYC Parks Socrata dataset.
     
     Uses dataset 'fudw-fgrp' (NYC Parks Public Events).
-    Supports optional borough filtering via SoQL.
+    Date and optional borough filtering happen server-side via `$where`.
     
     Args:
         days_ahead: Number of days ahead to fetch events for
@@ -719,47 +1636,82 @@ async def get_socrata_parks_events(
     """
     dataset_id = "fudw-fgrp"  # NYC Parks Public Events
     
-    # Build SoQL query for date filtering
+    # Date window for filtering
     today = datetime.now()
     future_date = today + timedelta(days=days_ahead)
     
     # Format dates for SoQL (Socrata uses ISO format)
-    today_str = today.strftime("%Y-%m-%d")
-    future_str = future_date.strftime("%Y-%m-%d")
+    today_str = f"{today:%Y-%m-%d}"
+    future_str = f"{future_date:%Y-%m-%d}"
     
-    # Build SoQL WHERE clause
-    where_clauses = [f"date >= '{today_str}'", f"date <= '{future_str}'"]
+    # Server-side $where filter; borough is skipped when not given
+    where = {"date_gte": today_str, "date_lte": future_str, "borough": borough}
     
-    if borough:
-        # Add borough filter if specified
-        where_clauses.append(f"borough = '{borough}'")
+    logger.info(f"Fetching Socrata parks events with filter: {where}")
     
-    soql = f"SELECT * WHERE {' AND '.join(where_clauses)}"
+    # Producer streams records into a bounded queue while consumers analyze and
+    # geocode them in batches, so transforms start with the first page
+    queue: "asyncio.Queue[Optional[Tuple[int, Dict[str, Any]]]]" = asyncio.Queue(maxsize=SOCRATA_QUEUE_SIZE)
+    results: List[Tuple[int, CivicEvent]] = []
     
-    logger.info(f"Fetching Socrata parks events with SoQL: {soql}")
-    
-    try:
-        raw_records = await get_socrata_dataset_async(
-            dataset_id=dataset_id, 
-            soql=soql, 
-            limit=limit
-        )
-        
-        logger.info(f"Retrieved {len(raw_records)} raw records from Socrata parks dataset")
-        
-        civic_events: List[CivicEvent] = []
-        for raw in raw_records:
+    async def produce() -> int:
+        count = 0
+        seen_ids: Set[str] = set()
+        try:
+            async for raw in iter_socrata_dataset_async(dataset_id=dataset_id, where=where, limit=limit):
+                fields = _socrata_fields(raw)
+                # Repeated records (same source ID) are dropped before any paid analysis/geocoding
+                if fields["event_id"] in seen_ids:
+                    continue
+                seen_ids.add(fields["event_id"])
+                await queue.put((count, fields))
+                count += 1
+        except Exception as e:
+            # Keep whatever was already queued; consumers drain it after the sentinels
+            logger.error(f"Socrata parks stream failed after {count} records: {e}")
+        finally:
+            for _ in range(SOCRATA_CONSUMERS):
+                await queue.put(None)
+        return count
+    
+    async def consume() -> None:
+        done = False
+        while not done:
+            # Fill a full Gemini batch, or whatever is left once the producer is done
+            batch: List[Tuple[int, Dict[str, Any]]] = []
+            item = await queue.get()
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= ANALYSIS_BATCH_SIZE:
+                    break
+                item = await queue.get()
+            done = item is None
+            if not batch:
+                continue
             try:
-                civic = await transform_socrata_to_civic_event(raw)
-                civic_events.append(civic)
+                results.extend(await _transform_socrata_batch(batch))
             except Exception as e:
-                logger.debug(f"Failed to transform Socrata record: {e}")
-                continue
-        
-        logger.info(f"Transformed {len(civic_events)} Socrata parks events")
-        return civic_events
-        
+                # Keep consuming so the producer never blocks on a full queue
+                logger.error(f"Failed to transform Socrata batch: {e}")
+    
+    produced = 0
+    consumers = [asyncio.create_task(consume()) for _ in range(SOCRATA_CONSUMERS)]
+    try:
+        produced = await produce()
+        await asyncio.gather(*consumers)
     except Exception as e:
         logger.error(f"Failed to fetch Socrata parks events: {e}")
-        return []
+    finally:
+        # No-op once the consumers finished; stops them if produce() was cancelled
+        for task in consumers:
+            task.cancel()
+        await asyncio.gather(*consumers, return_exceptions=True)
+    
+    logger.info(f"Retrieved {produced} unique raw records from Socrata parks dataset")
+    
+    results.sort(key=lambda indexed: indexed[0])
+    civic_events = [civic for _, civic in results]
+    
+    logger.info(f"Transformed {len(civic_events)} Socrata parks events")
+    return civic_events
 
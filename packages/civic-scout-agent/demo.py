@@ -9,7 +9,7 @@ This script demonstrates the full agentic pipeline:
 """
 
 import requests
-import json
+import orjson
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -35,7 +35,7 @@ def demo():
     try:
         response = requests.get("http://localhost:8001/api/events?days_ahead=7")
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         events = data.get("events", [])
         console.print(f"✅ Retrieved {len(events)} upcoming civic events\n", style="green")
@@ -14,23 +14,38 @@ Endpoints:
 
 import os
 import asyncio
+import hashlib
 import logging
+import time
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request, Response, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 
-from models import CivicEvent, EventsResponse, HealthResponse
+from models import CivicEvent, EventsResponse, GeminiAnalysisOutput, HealthResponse
 from civic_tools import (
     get_legistar_events,
     get_socrata_parks_events,
-    geocode_address,
-    analyze_event_with_gemini,
+    batch_geocode,
+    analyze_events_batch,
     analyze_pdf_agenda,
     transform_legistar_to_civic_event,
+    parse_event_date,
+    get_http_client,
+    close_http_clients,
+    warm_geocode_cache,
+    GEOCODE_STATS,
+    ANALYSIS_STATS,
+    OFFLOAD_MIN_EVENTS,
+    ANALYSIS_TOPICS,
     CIVIC_KEYWORDS
 )
 
@@ -49,6 +64,20 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 APP_VERSION = "1.0.0"
+
+# Max PDF agendas downloaded and analyzed at once
+PDF_CONCURRENCY = 5
+
+# Reference endpoints (/api/topics, /api/keywords) are static per deploy
+STATIC_CACHE_CONTROL = "public, max-age=86400"
+
+# Browser origins allowed to call the API (comma-separated); defaults to the local dev servers
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:5173,http://localhost:3000").split(",")
+    if origin.strip()
+]
+
 APP_TITLE = "NYC Civic Scout Agent API"
 APP_DESCRIPTION = """
 The NYC Civic Scout Agent API provides processed civic event data with AI-powered
@@ -69,6 +98,10 @@ API keys are required for full functionality:
 - `GOOGLE_MAPS_API_KEY` - Google Maps Geocoding
 """
 
+# Whole-pipeline results per (days_ahead, filter_keywords, include_pdf), in seconds
+PIPELINE_CACHE_TTL = 600
+PIPELINE_CACHE_MAXSIZE = 32
+
 # =============================================================================
 # Application Lifecycle
 # =============================================================================
@@ -91,10 +124,21 @@ async def lifespan(app: FastAPI):
     if not legistar_token:
         logger.warning("LEGISTAR_API_TOKEN not set - API rate limits may apply")
     
+    # Open the shared HTTP pool up front so the first request doesn't pay for it
+    app.state.http = get_http_client()
+    
+    # Load persisted geocodes into memory so repeat venues skip the disk cache too
+    warmed = await asyncio.to_thread(warm_geocode_cache)
+    logger.info(f"Warmed geocode cache with {warmed} addresses")
+    app.state.geocode_stats = GEOCODE_STATS
+    
     yield
     
     # Shutdown
     logger.info("Shutting down NYC Civic Scout Agent")
+    for task in list(_refresh_tasks):
+        task.cancel()
+    await close_http_clients()
 
 # =============================================================================
 # FastAPI Application
@@ -105,19 +149,25 @@ app = FastAPI(
     description=APP_DESCRIPTION,
     version=APP_VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
 
-# Configure CORS for frontend access - allow all origins in development
+# Configure CORS for frontend access - a static allowlist lets browsers cache preflights
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins for development
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "OPTIONS"],
+    allow_headers=["authorization", "content-type"],
+    expose_headers=["X-Cache"],
+    max_age=86400
 )
 
+# Event lists are repetitive JSON (topics, timestamps, addresses) and compress well
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # =============================================================================
 # The Agentic Orchestrator Pipeline
 # =============================================================================
@@ -132,10 +182,13 @@ async def run_civic_scout_pipeline(
     
     This function orchestrates multiple agents/tools:
     1. Discovery Agent (get_legistar_events) - Fetch raw event data
-    2. Analyst Agent (analyze_event_with_gemini) - AI impact analysis
-    3. Geolocation Tool (geocode_address) - Add coordinates
+    2. Analyst Agent (analyze_events_batch) - AI impact analysis
+    3. Geolocation Tool (batch_geocode) - Add coordinates
     4. Optional: PDF Tool (analyze_pdf_agenda) - Extract agenda details
     
+    The Legistar branch and the Socrata parks fetch hit independent hosts,
+    so they run concurrently; total latency is the slower of the two.
+    
     Args:
         days_ahead: Number of days to look ahead for events
         filter_keywords: Whether to filter events by civic keywords
@@ -146,9 +199,87 @@ async def run_civic_scout_pipeline(
     """
     logger.info(f"Starting Civic Scout pipeline: {days_ahead} days ahead, filter={filter_keywords}")
     
+    legistar_result, socrata_result = await asyncio.gather(
+        process_legistar_events(days_ahead, filter_keywords, include_pdf_analysis),
+        get_socrata_parks_events(days_ahead=days_ahead),
+        return_exceptions=True
+    )
+    
+    processed_events: List[CivicEvent] = []
+    if isinstance(legistar_result, Exception):
+        logger.error(f"Legistar pipeline failed: {legistar_result}")
+    else:
+        processed_events.extend(legistar_result)
+    
+    # Integrate Socrata parks events
+    if isinstance(socrata_result, Exception):
+        logger.warning(f"Failed to fetch or transform Socrata parks events: {socrata_result}")
+    elif socrata_result:
+        processed_events.extend(socrata_result)
+        logger.info(f"Appended {len(socrata_result)} events from Socrata parks dataset")
+    
+    processed_events = dedupe_events(processed_events)
+    
+    logger.info(f"Pipeline complete: {len(processed_events)} events processed")
+    return processed_events
+
+
+def dedupe_events(events: List[CivicEvent]) -> List[CivicEvent]:
+    """
+    Drop cross-source duplicates (the same meeting listed by Legistar and
+    Socrata), keeping the first occurrence. Events match on normalized title,
+    full start time and location; each source already drops repeated records
+    by ID before analysis.
+    """
+    seen = set()
+    unique: List[CivicEvent] = []
+    for event in events:
+        key = (
+            " ".join(event.title.lower().split()),
+            event.date_time,
+            " ".join(event.location.lower().split())
+        )
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(event)
+    
+    if len(unique) < len(events):
+        logger.info(f"Dropped {len(events) - len(unique)} duplicate events")
+    return unique
+
+
+def dedupe_raw_events(raw_events: List[dict]) -> List[dict]:
+    """
+    Collapse Legistar records sharing an EventId (rolling windows and committee
+    cross-listings repeat them), keeping the most recently modified copy so each
+    meeting is analyzed and geocoded once. Records without an EventId are kept.
+    """
+    newest: Dict[object, dict] = {}
+    for raw_event in raw_events:
+        key = raw_event.get("EventId", id(raw_event))
+        current = newest.get(key)
+        # EventLastModifiedUtc is ISO 8601, so string order is time order
+        if current is None or (raw_event.get("EventLastModifiedUtc") or "") > (current.get("EventLastModifiedUtc") or ""):
+            newest[key] = raw_event
+    
+    if len(newest) < len(raw_events):
+        logger.info(f"dedup: dropped {len(raw_events) - len(newest)} duplicate Legistar events")
+    return list(newest.values())
+
+
+async def process_legistar_events(
+    days_ahead: int,
+    filter_keywords: bool,
+    include_pdf_analysis: bool
+) -> List[CivicEvent]:
+    """
+    Legistar branch of the pipeline: discovery, optional PDF context,
+    batched analysis, geocoding and transformation.
+    """
     # Step 1: DISCOVERY - Fetch raw events from Legistar
     try:
-        raw_events = get_legistar_events(
+        raw_events = await get_legistar_events(
             days_ahead=days_ahead,
             filter_keywords=filter_keywords
         )
@@ -156,50 +287,90 @@ async def run_civic_scout_pipeline(
         logger.error(f"Discovery agent failed: {e}")
         raw_events = []
     
+    raw_events = dedupe_raw_events(raw_events)
+    
     if not raw_events:
         logger.warning("No events retrieved from Legistar - check API credentials")
     
     logger.info(f"Processing {len(raw_events)} events through analysis pipeline")
     
-    # Step 2-4: Process each event through analysis and geocoding
+    # Optional: Download and analyze PDF agendas concurrently (bounded) up front
+    pdf_contexts: List[str] = [""] * len(raw_events)
+    if include_pdf_analysis:
+        semaphore = asyncio.Semaphore(PDF_CONCURRENCY)
+        
+        async def agenda_context(i: int, raw_event: dict) -> Optional[str]:
+            async with semaphore:
+                return await analyze_pdf_agenda(
+                    raw_event.get("EventAgendaFile"),
+                    str(raw_event.get("EventId", i)),
+                    published=raw_event.get("EventAgendaLastPublishedUTC")
+                )
+        
+        pdf_results = await asyncio.gather(
+            *(agenda_context(i, raw_event) for i, raw_event in enumerate(raw_events)),
+            return_exceptions=True
+        )
+        pdf_contexts = [
+            result if isinstance(result, str) else ""
+            for result in pdf_results
+        ]
+    
+    # Steps 2 + 3 are independent, so they run concurrently:
+    # ANALYST AGENT - AI analysis, batched into as few Gemini requests as possible
+    # GEOLOCATION - Geocode each distinct address once
+    locations = [
+        raw_event.get("EventLocation", "City Hall, New York, NY")
+        for raw_event in raw_events
+    ]
+    analyses, coord_map = await asyncio.gather(
+        analyze_events_batch([
+            {
+                "event_id": str(raw_event.get("EventId", i)),
+                "title": raw_event.get("EventBodyName", "City Council Meeting"),
+                "body": raw_event.get("EventBodyName", ""),
+                "date": raw_event.get("EventDate", ""),
+                "location": locations[i],
+                # Agenda context gathered above (empty when PDF analysis is disabled)
+                "context": pdf_contexts[i]
+            }
+            for i, raw_event in enumerate(raw_events)
+        ]),
+        batch_geocode(locations)
+    )
+    all_coordinates = [coord_map[location] for location in locations]
+    
+    # Step 4: Transform each event. Pydantic validation is CPU-bound, so large
+    # calendars are assembled in a worker thread to keep the event loop free.
+    if len(raw_events) >= OFFLOAD_MIN_EVENTS:
+        return await asyncio.to_thread(assemble_legistar_events, raw_events, analyses, all_coordinates)
+    return assemble_legistar_events(raw_events, analyses, all_coordinates)
+
+
+def assemble_legistar_events(
+    raw_events: List[dict],
+    analyses: List[GeminiAnalysisOutput],
+    all_coordinates: List[Tuple[Optional[float], Optional[float], Optional[str]]]
+) -> List[CivicEvent]:
+    """
+    Build CivicEvents from raw Legistar records and their analyses and
+    coordinates (all index-aligned). Plain blocking code, safe to run in a
+    worker thread; events that fail to transform are logged and skipped.
+    """
     processed_events: List[CivicEvent] = []
     
-    for i, raw_event in enumerate(raw_events):
+    for i, (raw_event, analysis, coordinates) in enumerate(zip(raw_events, analyses, all_coordinates)):
         event_id = str(raw_event.get("EventId", i))
         logger.debug(f"Processing event {event_id} ({i+1}/{len(raw_events)})")
         
         try:
-            # Extract event details for analysis
-            title = raw_event.get("EventBodyName", "City Council Meeting")
-            body = raw_event.get("EventBodyName", "")
-            date = raw_event.get("EventDate", "")
-            location = raw_event.get("EventLocation", "City Hall, New York, NY")
-            
-            # Optional: Analyze PDF agenda for additional context
-            context = ""
-            if include_pdf_analysis:
-                agenda_url = raw_event.get("EventAgendaFile")
-                if agenda_url:
-                    context = await analyze_pdf_agenda(agenda_url, event_id) or ""
-            
-            # Step 2: ANALYST AGENT - AI analysis
-            analysis = analyze_event_with_gemini(
-                event_id=event_id,
-                title=title,
-                body=body,
-                date=date,
-                location=location,
-                context=context
-            )
-            
-            # Step 3: GEOLOCATION - Geocode the address
-            coordinates = geocode_address(location)
-            
-            # Step 4: TRANSFORM - Create final CivicEvent
+            # TRANSFORM - Create final CivicEvent; EventDate is parsed once here
+            # and formatted straight from the datetime
             civic_event = transform_legistar_to_civic_event(
                 raw_event=raw_event,
                 analysis=analysis,
-                coordinates=coordinates
+                coordinates=coordinates,
+                event_date=parse_event_date(raw_event.get("EventDate", ""))
             )
             
             processed_events.append(civic_event)
@@ -208,20 +379,94 @@ async def run_civic_scout_pipeline(
             logger.error(f"Failed to process event {event_id}: {e}")
             continue
     
-    # Step 5: Fetch and integrate Socrata parks events
-    try:
-        logger.info("Fetching Socrata parks events...")
-        socrata_events = await get_socrata_parks_events(days_ahead=days_ahead)
-        if socrata_events:
-            processed_events.extend(socrata_events)
-            logger.info(f"Appended {len(socrata_events)} events from Socrata parks dataset")
-    except Exception as e:
-        logger.warning(f"Failed to fetch or transform Socrata parks events: {e}")
-    
-    logger.info(f"Pipeline complete: {len(processed_events)} events processed")
     return processed_events
 
 
+# =============================================================================
+# Pipeline Response Cache
+# =============================================================================
+
+PipelineKey = Tuple[int, bool, bool]
+
+# key -> (monotonic expiry, events); expired entries stay as the stale fallback
+# until refreshed. Insertion order doubles as age for eviction.
+_pipeline_cache: Dict[PipelineKey, Tuple[float, List[CivicEvent]]] = {}
+_pipeline_locks: Dict[PipelineKey, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+# Strong references to in-flight background refreshes (the loop only keeps weak ones)
+_refresh_tasks: Set[asyncio.Task] = set()
+
+
+def _is_fresh(key: PipelineKey) -> bool:
+    """True if key has a cached result that has not yet expired."""
+    entry = _pipeline_cache.get(key)
+    return entry is not None and entry[0] > time.monotonic()
+
+
+async def _refresh_pipeline(key: PipelineKey) -> List[CivicEvent]:
+    """
+    Run the pipeline for key and store the result. Callers queued on the same
+    key's lock reuse the first run's result instead of starting their own.
+    """
+    async with _pipeline_locks[key]:
+        if _is_fresh(key):
+            return _pipeline_cache[key][1]
+        
+        days_ahead, filter_keywords, include_pdf = key
+        events = await run_civic_scout_pipeline(
+            days_ahead=days_ahead,
+            filter_keywords=filter_keywords,
+            include_pdf_analysis=include_pdf
+        )
+        
+        # An empty result usually means an upstream outage; keep serving the
+        # previous (stale) result rather than replacing it
+        if events:
+            _pipeline_cache.pop(key, None)
+            if len(_pipeline_cache) >= PIPELINE_CACHE_MAXSIZE:
+                del _pipeline_cache[next(iter(_pipeline_cache))]
+            _pipeline_cache[key] = (time.monotonic() + PIPELINE_CACHE_TTL, events)
+        return events
+
+
+def _schedule_refresh(key: PipelineKey) -> None:
+    """Refresh key in the background unless a refresh is already running."""
+    if _pipeline_locks[key].locked():
+        return
+    
+    task = asyncio.create_task(_refresh_pipeline(key))
+    _refresh_tasks.add(task)
+    
+    def _done(task: asyncio.Task) -> None:
+        _refresh_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(f"Background pipeline refresh failed for {key}: {task.exception()}")
+    
+    task.add_done_callback(_done)
+
+
+async def get_cached_pipeline(key: PipelineKey) -> Tuple[List[CivicEvent], str]:
+    """
+    Serve pipeline output for (days_ahead, filter_keywords, include_pdf) with
+    stale-while-revalidate: fresh results are returned as-is, expired ones are
+    returned immediately while a background task refreshes them, and only a
+    cold key makes the caller wait for the pipeline.
+    
+    Args:
+        key: Tuple of the /api/events query parameters
+    
+    Returns:
+        (events, cache_status) where cache_status is "HIT", "STALE" or "MISS"
+    """
+    entry = _pipeline_cache.get(key)
+    if entry is not None:
+        if entry[0] > time.monotonic():
+            return entry[1], "HIT"
+        _schedule_refresh(key)
+        return entry[1], "STALE"
+    
+    return await _refresh_pipeline(key), "MISS"
+
 
 # =============================================================================
 # API Endpoints
@@ -243,7 +488,7 @@ async def get_events(
         default=False,
         description="Include PDF agenda analysis (slower)"
     )
-) -> EventsResponse:
+) -> ORJSONResponse:
     """
     Fetch and process NYC civic events.
     
@@ -262,18 +507,19 @@ async def get_events(
     - List of processed civic events with AI-generated impact summaries
     """
     try:
-        events = await run_civic_scout_pipeline(
-            days_ahead=days_ahead,
-            filter_keywords=filter_keywords,
-            include_pdf_analysis=include_pdf
-        )
+        events, cache_status = await get_cached_pipeline((days_ahead, filter_keywords, include_pdf))
         
-        return EventsResponse(
+        response = EventsResponse(
             events=events,
             count=len(events),
             source="legistar",
             generated_at=datetime.now().isoformat()
         )
+        # Already validated; skip jsonable_encoder and serialize straight with orjson
+        return ORJSONResponse(
+            response.model_dump(),
+            headers={"X-Cache": cache_status}
+        )
         
     except Exception as e:
         logger.error(f"Pipeline failed: {e}")
@@ -290,42 +536,65 @@ async def health_check() -> HealthResponse:
     
     Returns the status of the API and connected services.
     """
-    # Check service availability
-    services = {
-        "gemini": bool(os.getenv("GEMINI_API_KEY")),
-        "google_maps": bool(os.getenv("GOOGLE_MAPS_API_KEY")),
-        "legistar": True  # Public API, always "available"
-    }
-    
     return HealthResponse(
         status="healthy",
         version=APP_VERSION,
-        services=services
+        services=_health_services(),
+        cache_hit_rates={
+            "analysis": _hit_rate(ANALYSIS_STATS),
+            "geocode": _hit_rate(GEOCODE_STATS)
+        }
     )
 
 
-@app.get("/api/topics", tags=["Reference"])
-async def get_topics() -> dict:
-    """Get the list of available topic categories."""
+@lru_cache(maxsize=1)
+def _health_services() -> Dict[str, bool]:
+    """
+    Check service availability on first use (after .env has been loaded).
+    It is fixed by the environment, so it is built once per process.
+    """
     return {
-        "topics": [
-            "Legislation/Policy",
-            "Zoning/Housing",
-            "Budget/Finance",
-            "Education",
-            "Transportation",
-            "Public Safety",
-            "Health/Social Services",
-            "Environment",
-            "Other"
-        ]
+        "gemini": bool(os.getenv("GEMINI_API_KEY")),
+        "google_maps": bool(os.getenv("GOOGLE_MAPS_API_KEY")),
+        "legistar": True  # Public API, always "available"
     }
 
 
+def _hit_rate(stats: Dict[str, int]) -> float:
+    """Fraction of cache lookups that were hits, from a *_STATS counter dict."""
+    lookups = sum(stats.values())
+    return round((lookups - stats["misses"]) / lookups, 3) if lookups else 0.0
+
+
+def _static_json(payload: dict) -> Tuple[bytes, str]:
+    """Serialize a static payload once and derive its strong ETag."""
+    body = orjson.dumps(payload)
+    return body, f'"{hashlib.md5(body).hexdigest()}"'
+
+
+def _static_response(request: Request, body: bytes, etag: str) -> Response:
+    """Serve a pre-serialized static body, answering matching If-None-Match with 304."""
+    headers = {"Cache-Control": STATIC_CACHE_CONTROL, "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# Reference payloads never change while the process runs
+_TOPICS_BODY, _TOPICS_ETAG = _static_json({"topics": ANALYSIS_TOPICS})
+_KEYWORDS_BODY, _KEYWORDS_ETAG = _static_json({"keywords": CIVIC_KEYWORDS})
+
+
+@app.get("/api/topics", tags=["Reference"])
+async def get_topics(request: Request) -> Response:
+    """Get the list of available topic categories."""
+    return _static_response(request, _TOPICS_BODY, _TOPICS_ETAG)
+
+
 @app.get("/api/keywords", tags=["Reference"])
-async def get_keywords() -> dict:
+async def get_keywords(request: Request) -> Response:
     """Get the list of civic keywords used for filtering."""
-    return {"keywords": CIVIC_KEYWORDS}
+    return _static_response(request, _KEYWORDS_BODY, _KEYWORDS_ETAG)
 
 
 # =============================================================================
@@ -336,11 +605,19 @@ if __name__ == "__main__":
     import uvicorn
     
     port = int(os.getenv("PORT", 8001))
+    # Auto-reload (a file-watching supervisor) is for local development only
+    dev = os.getenv("ENV") == "dev"
     
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=port,
-        reload=True,
-        log_level="info"
+        reload=dev,
+        # Reload mode runs a single process; otherwise scale across cores
+        workers=None if dev else int(os.getenv("WEB_CONCURRENCY", "1")),
+        log_level=os.getenv("LOG_LEVEL", "info" if dev else "warning"),
+        access_log=dev,
+        # "auto" picks uvloop and httptools when installed (uvicorn[standard])
+        loop="auto",
+        http="auto"
     )
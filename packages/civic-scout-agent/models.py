@@ -5,8 +5,8 @@ These models define the structured output schema for the entire pipeline,
 ensuring type safety and consistent API responses.
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, Optional, List
 from enum import Enum
 
 
@@ -28,6 +28,8 @@ class GeminiAnalysisOutput(BaseModel):
     Schema for Gemini's structured output response.
     Used to enforce JSON schema in the Gemini API call.
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     event_id: str = Field(description="The unique identifier of the event")
     impact_score: int = Field(
         ge=1, le=5,
@@ -36,7 +38,7 @@ class GeminiAnalysisOutput(BaseModel):
     community_impact_summary: str = Field(
         description="A 2-sentence non-technical summary explaining why a resident should care"
     )
-    topic: str = Field(
+    topic: EventTopic = Field(
         description="The classified topic category of the event"
     )
 
@@ -46,13 +48,15 @@ class CivicEvent(BaseModel):
     The primary output model for a processed civic event.
     This dictates the structured output of the entire pipeline.
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     id: str = Field(description="Unique identifier for the event")
     title: str = Field(description="The title/subject of the event")
     date_time: str = Field(description="ISO 8601 formatted date and time of the event")
     location: str = Field(description="Physical location/address of the event")
     link: str = Field(description="URL to the official event page or agenda")
-    topic: str = Field(
-        default="Other",
+    topic: EventTopic = Field(
+        default=EventTopic.OTHER,
         description="Classified topic (e.g., 'Legislation/Policy', 'Education')"
     )
     impact_score: int = Field(
@@ -83,6 +87,8 @@ class LegistarEvent(BaseModel):
     Raw event data structure from the Legistar API.
     Used for parsing incoming API responses.
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     EventId: int
     EventGuid: Optional[str] = None
     EventLastModifiedUtc: Optional[str] = None
@@ -104,7 +110,6 @@ class LegistarEvent(BaseModel):
     EventComment: Optional[str] = None
     EventVideoPath: Optional[str] = None
     EventInSiteURL: Optional[str] = None
-    EventItems: Optional[List[dict]] = None
 
 
 class EventsResponse(BaseModel):
@@ -119,4 +124,8 @@ class HealthResponse(BaseModel):
     """API response model for the /health endpoint."""
     status: str
     version: str
-    services: dict
+    services: Dict[str, bool]
+    cache_hit_rates: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Share of lookups served from cache since startup, per cache"
+    )
@@ -1,11 +1,18 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import hashlib
+import orjson
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
-import time
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import googlemaps
 import google.generativeai as genai
 import re
+import threading
 
 # The base URL for the NYC Parks Events dataset on the Socrata platform.
 # NOTE: This dataset appears to contain historical data from 2019. For current events,
@@ -17,6 +24,123 @@ import re
 # - Google Calendar API if events are published there
 NYC_PARKS_API_ENDPOINT = "https://data.cityofnewyork.us/resource/fudw-fgrp.json"
 
+# Council calendar page, fetched with browser-like headers (static, so built once)
+COUNCIL_CALENDAR_URL = 'https://council.nyc.gov/calendar/'
+COUNCIL_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# Parse-time filters: only matching elements (with their subtrees) become Python objects,
+# so navigation/footer markup is skipped instead of built and then walked
+_EVENT_CLASS_STRAINER = SoupStrainer(class_=re.compile(r'event|meeting|hearing', re.I))
+_ARTICLE_STRAINER = SoupStrainer('article')
+
+# Council calendar event containers, tried in order until one matches:
+# (strainer that keeps every candidate, CSS selector run by soupsieve)
+COUNCIL_EVENT_SELECTORS = (
+    (_EVENT_CLASS_STRAINER, 'div[class*="event" i], div[class*="meeting" i], div[class*="hearing" i]'),
+    (_ARTICLE_STRAINER, 'article'),
+    (_EVENT_CLASS_STRAINER, 'li[class*="event" i]'),
+)
+
+# Borough name -> lowercase needle looked for in scraped event locations
+_BOROUGH_NEEDLES = {
+    "Bronx": "bronx",
+    "Brooklyn": "brooklyn",
+    "Manhattan": "manhattan",
+    "Queens": "queens",
+    "Staten Island": "staten island",
+}
+
+# Per-event field lookups by CSS class, compiled once rather than per scraped event
+_DATE_CLASS_RE = re.compile(r'date', re.I)
+_LOCATION_CLASS_RE = re.compile(r'location|venue', re.I)
+
+# Shared HTTP session: keeps connections to data.cityofnewyork.us and council.nyc.gov
+# alive between calls, and retries rate limits / transient 5xx with exponential backoff
+# (honoring Retry-After on 429s)
+_session = requests.Session()
+_session.headers.update({"Accept-Encoding": "gzip, deflate"})
+_retry_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True
+    )
+)
+_session.mount("https://", _retry_adapter)
+_session.mount("http://", _retry_adapter)
+
+# (connect, read) seconds: fail fast on an unreachable host, allow slower bodies
+HTTP_TIMEOUT = (3, 10)
+
+# Max geocoding requests in flight at once (well under the Maps 50 QPS limit)
+GEOCODE_WORKERS = 10
+
+# In-process memo sizes; recurring venues and meeting titles skip the network
+GEOCODE_CACHE_SIZE = 4096
+SUMMARY_CACHE_SIZE = 4096
+
+# Events with no description and a title shorter than this give Gemini nothing
+# the keyword heuristic doesn't already have, so they skip the API
+LLM_MIN_TITLE_LENGTH = 80
+
+# Gemini summaries keyed by a short digest of title + description (bounded key size).
+# Requests summarize from concurrent to_thread workers, so every access holds the lock
+_summary_cache = OrderedDict()
+_summary_cache_lock = threading.Lock()
+
+# Shared Google Maps client, built on first use (reuses its HTTP session across calls)
+_gmaps_client = None
+
+def _gmaps():
+    """Return the shared googlemaps.Client, or None if GOOGLE_MAPS_API_KEY is not set."""
+    global _gmaps_client
+    if _gmaps_client is None:
+        api_key = os.getenv("GOOGLE_MAPS_API_KEY")
+        if api_key:
+            _gmaps_client = googlemaps.Client(key=api_key, timeout=10)
+    return _gmaps_client
+
+# Gemini model for impact summaries; must support JSON mode (response_mime_type),
+# which the batched summary request relies on. Same model as civic_tools.py.
+GEMINI_MODEL_NAME = "gemini-2.5-flash"
+
+# Shared Gemini model, configured once on first use
+_gemini_model = None
+
+def _gemini():
+    """Return the shared GenerativeModel, or None if GEMINI_API_KEY is not set."""
+    global _gemini_model
+    if _gemini_model is None:
+        api_key = os.getenv("GEMINI_API_KEY")
+        if api_key:
+            genai.configure(api_key=api_key)
+            _gemini_model = genai.GenerativeModel(GEMINI_MODEL_NAME)
+    return _gemini_model
+
+def _stable_id(*parts: str) -> int:
+    """Deterministic 64-bit ID from string parts (unlike hash(), not salted per process)."""
+    digest = hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+def _parse_event_day(date_time: str):
+    """Calendar date of an ISO 8601 date/datetime string, or None if it can't be parsed."""
+    if not date_time:
+        return None
+    try:
+        return datetime.fromisoformat(date_time.replace('Z', '+00:00')).date()
+    except ValueError:
+        return None
+
 # --- Function Tool Definition ---
 # This function is what the main Gemini Agent will "see" and "call."
 
@@ -33,24 +157,62 @@ def geocode_address(address: str) -> dict:
     if not address or not address.strip():
         return {}
     
-    api_key = os.getenv("GOOGLE_MAPS_API_KEY")
-    if not api_key:
+    if not _gmaps():
         print("⚠️ GOOGLE_MAPS_API_KEY not set. Skipping geocoding.")
         return {}
     
     try:
-        gmaps = googlemaps.Client(key=api_key)
-        geocode_result = gmaps.geocode(address)
-        
-        if geocode_result:
-            location = geocode_result[0]['geometry']['location']
-            return {"lat": location['lat'], "lng": location['lng']}
-        else:
-            print(f"⚠️ No geocoding results for: {address}")
-            return {}
+        coords = _geocode_cached(_normalize_location(address))
     except Exception as e:
+        # Errors propagate out of the memo, so a failed lookup is retried next time
         print(f"❌ Geocoding error: {e}")
         return {}
+    return {"lat": coords[0], "lng": coords[1]} if coords else {}
+
+def _normalize_location(address: str) -> str:
+    """Case- and whitespace-insensitive form of a venue string, used as the geocode key."""
+    return " ".join(address.lower().split())
+
+@lru_cache(maxsize=GEOCODE_CACHE_SIZE)
+def _geocode_cached(address: str):
+    """Memoized Maps lookup: (lat, lng), or None when the address has no results."""
+    geocode_result = _gmaps().geocode(address)
+    if not geocode_result:
+        print(f"⚠️ No geocoding results for: {address}")
+        return None
+    location = geocode_result[0]['geometry']['location']
+    return (location['lat'], location['lng'])
+
+def geocode_many(addresses: list) -> dict:
+    """
+    Geocodes a list of addresses concurrently, one request per distinct venue.
+    
+    Args:
+        addresses: Address strings to geocode (duplicates and blanks allowed).
+        
+    Returns:
+        A dict mapping each non-blank address (as given) to its geocode_address() result.
+    """
+    # Venues spelled with different case/spacing share one lookup
+    by_venue = {}
+    for address in addresses:
+        if address and address.strip():
+            by_venue.setdefault(_normalize_location(address), []).append(address)
+    if not by_venue:
+        return {}
+    
+    # Build the shared client (or warn once) before fanning out to worker threads
+    if not _gmaps():
+        print("⚠️ GOOGLE_MAPS_API_KEY not set. Skipping geocoding.")
+        return {address: {} for spellings in by_venue.values() for address in spellings}
+    
+    with ThreadPoolExecutor(max_workers=min(GEOCODE_WORKERS, len(by_venue))) as pool:
+        results = pool.map(geocode_address, by_venue)
+        return {
+            address: coords
+            for spellings, coords in zip(by_venue.values(), results)
+            for address in spellings
+        }
 
 def generate_impact_summary(title: str, description: str) -> str:
     """
@@ -63,48 +225,107 @@ def generate_impact_summary(title: str, description: str) -> str:
     Returns:
         A short impact summary string.
     """
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        print("⚠️ GEMINI_API_KEY not set. Using heuristic summary.")
-        return _heuristic_summary(title, description)
+    return generate_impact_summaries([(title, description)])[0]
+
+def generate_impact_summaries(events: list) -> list:
+    """
+    Generates impact summaries for many events with a single Gemini request.
     
-    try:
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-pro')
-        
-        prompt = f"""
-        Analyze this civic event and provide a concise 1-2 sentence summary of its potential impact on the community.
-        
-        Title: {title}
-        Description: {description}
-        
-        Focus on how this affects residents, neighborhoods, or local democracy. Keep it under 50 words.
-        """
+    Args:
+        events: List of (title, description) tuples.
         
-        response = model.generate_content(prompt)
-        summary = response.text.strip()
-        return summary if len(summary) <= 100 else summary[:97] + "..."
-    except Exception as e:
-        print(f"❌ Gemini API error: {e}. Using heuristic.")
-        return _heuristic_summary(title, description)
+    Returns:
+        A list of short impact summary strings, in the same order as events.
+        Title-only events with short titles, and events Gemini could not
+        summarize, get the heuristic summary.
+    """
+    model = _gemini()
+    if not model:
+        print("⚠️ GEMINI_API_KEY not set. Using heuristic summary.")
+        return [_heuristic_summary(title, description) for title, description in events]
+    
+    keys = [
+        hashlib.blake2b(f"{title}\0{description}".encode("utf-8"), digest_size=16).hexdigest()
+        for title, description in events
+    ]
+    
+    # One prompt entry per distinct event not already memoized and worth an LLM call
+    pending = {}
+    with _summary_cache_lock:
+        for key, (title, description) in zip(keys, events):
+            if key in _summary_cache:
+                _summary_cache.move_to_end(key)
+            elif (description or "").strip() or len(title) >= LLM_MIN_TITLE_LENGTH:
+                pending.setdefault(key, (title, description))
+    
+    if pending:
+        try:
+            prompt = f"""
+            Analyze each civic event below and provide a concise 1-2 sentence summary of its potential impact on the community.
+            Focus on how it affects residents, neighborhoods, or local democracy. Keep each summary under 50 words.
+            
+            Return a JSON array of summary strings, one per event, in the same order.
+            
+            Events:
+            {orjson.dumps([{"title": title, "description": description} for title, description in pending.values()]).decode()}
+            """
+            
+            response = model.generate_content(
+                prompt,
+                generation_config={"response_mime_type": "application/json"}
+            )
+            summaries = orjson.loads(response.text)
+            if not isinstance(summaries, list) or len(summaries) != len(pending):
+                raise ValueError(f"expected {len(pending)} summaries, got {summaries!r:.80}")
+            
+            # Only real Gemini summaries are memoized; heuristic fallbacks retry next time
+            with _summary_cache_lock:
+                for key, summary in zip(pending, summaries):
+                    summary = str(summary).strip()
+                    _summary_cache[key] = summary if len(summary) <= 100 else summary[:97] + "..."
+                    if len(_summary_cache) > SUMMARY_CACHE_SIZE:
+                        _summary_cache.popitem(last=False)
+        except Exception as e:
+            print(f"❌ Gemini API error: {e}. Using heuristic.")
+    
+    with _summary_cache_lock:
+        cached = [_summary_cache.get(key) for key in keys]
+    return [
+        summary or _heuristic_summary(title, description)
+        for summary, (title, description) in zip(cached, events)
+    ]
+
+# Heuristic summary rules in priority order: (group name, keywords, summary)
+_HEURISTIC_SUMMARY_RULES = [
+    ("community", ["community", "public"], "Important community event affecting local residents."),
+    ("education", ["education", "school"], "Educational opportunity for community members."),
+    ("environment", ["environment", "park"], "Environmental and recreational event in public spaces."),
+]
+_HEURISTIC_SUMMARIES = {name: summary for name, _, summary in _HEURISTIC_SUMMARY_RULES}
+_HEURISTIC_DEFAULT_SUMMARY = "Community gathering with potential local impact."
+_HEURISTIC_PRIORITY = {name: rank for rank, (name, _, _) in enumerate(_HEURISTIC_SUMMARY_RULES)}
+# One named group per rule, so a single C-level scan finds every rule that matches
+_HEURISTIC_SUMMARY_RE = re.compile(
+    "|".join(
+        f"(?P<{name}>{'|'.join(map(re.escape, keywords))})"
+        for name, keywords, _ in _HEURISTIC_SUMMARY_RULES
+    ),
+    re.IGNORECASE
+)
 
 def _heuristic_summary(title: str, description: str) -> str:
     """Fallback heuristic summary."""
-    text = f"{title} {description}".lower()
-    
-    if "community" in text or "public" in text:
-        return "Important community event affecting local residents."
-    elif "education" in text or "school" in text:
-        return "Educational opportunity for community members."
-    elif "environment" in text or "park" in text:
-        return "Environmental and recreational event in public spaces."
-        return "Community gathering with potential local impact."
+    matched = {m.lastgroup for m in _HEURISTIC_SUMMARY_RE.finditer(f"{title} {description}")}
+    if matched:
+        # Highest-priority rule wins, as in the original if/elif chain
+        return _HEURISTIC_SUMMARIES[min(matched, key=_HEURISTIC_PRIORITY.__getitem__)]
+    return _HEURISTIC_DEFAULT_SUMMARY
 
 def get_nyc_council_events(days_ahead: int = 7, borough: str = None) -> list:
     """
     Fetches NYC Council meetings and civic events.
     Attempts to scrape https://council.nyc.gov/calendar/ with proper headers.
-    Falls back to sample data if scraping fails.
+    Returns an empty list if scraping fails (callers fall back to parks events).
     
     Args:
         days_ahead: Number of days ahead to look for events.
@@ -115,25 +336,31 @@ def get_nyc_council_events(days_ahead: int = 7, borough: str = None) -> list:
     """
     try:
         # Try scraping with browser-like headers
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-        
-        url = 'https://council.nyc.gov/calendar/'
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _session.get(COUNCIL_CALENDAR_URL, headers=COUNCIL_HEADERS, timeout=HTTP_TIMEOUT)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Parse the raw bytes with the C lxml parser; pass the declared charset so
+        # BeautifulSoup skips encoding detection (requests assumes Latin-1 otherwise)
+        declared = 'charset' in response.headers.get('Content-Type', '').lower()
+        from_encoding = response.encoding if declared else None
         
-        # Look for event containers - adjust selectors based on actual page structure
-        events = soup.find_all('div', class_=re.compile(r'event|meeting|hearing', re.I)) or \
-                soup.find_all('article') or \
-                soup.find_all('li', class_=re.compile(r'event', re.I))
+        # Look for event containers - adjust selectors based on actual page structure.
+        # Each strainer's partial tree is parsed at most once, and only if needed.
+        events = []
+        strained = {}
+        for strainer, selector in COUNCIL_EVENT_SELECTORS:
+            soup = strained.get(id(strainer))
+            if soup is None:
+                soup = strained[id(strainer)] = BeautifulSoup(
+                    response.content, 'lxml', from_encoding=from_encoding, parse_only=strainer
+                )
+            events = soup.select(selector)
+            if events:
+                break
+        
+        # Date window computed once per call, not per event
+        today = datetime.now().date()
+        horizon = today + timedelta(days=days_ahead)
         
         scraped_events = []
         for event_elem in events[:20]:  # Limit to avoid too many
@@ -141,18 +368,24 @@ def get_nyc_council_events(days_ahead: int = 7, borough: str = None) -> list:
             title_elem = event_elem.find('h3') or event_elem.find('a')
             title = title_elem.get_text(strip=True) if title_elem else "Untitled Event"
             
-            date_elem = event_elem.find('time') or event_elem.find(class_=re.compile(r'date', re.I))
+            date_elem = event_elem.find('time') or event_elem.find(class_=_DATE_CLASS_RE)
             date_time = date_elem.get('datetime') if date_elem else None
             
-            location_elem = event_elem.find(class_=re.compile(r'location|venue', re.I))
+            location_elem = event_elem.find(class_=_LOCATION_CLASS_RE)
             location = location_elem.get_text(strip=True) if location_elem else "TBD"
             
             link_elem = event_elem.find('a')
             link = link_elem.get('href') if link_elem else "https://council.nyc.gov/calendar/"
             
+            # Parse the date once; events outside the window are dropped before any
+            # Gemini or geocoding work (unparseable dates are kept)
+            event_day = _parse_event_day(date_time)
+            if event_day and not today <= event_day <= horizon:
+                continue
+            
             if title and date_time:
                 scraped_events.append({
-                    "id": hash(title + str(date_time)),  # Simple ID
+                    "id": _stable_id(title, str(date_time)),
                     "title": title,
                     "impact_summary": "",  # Will be filled by AI
                     "date_time": date_time,
@@ -163,28 +396,27 @@ def get_nyc_council_events(days_ahead: int = 7, borough: str = None) -> list:
         
         if scraped_events:
             print(f"✅ Scraped {len(scraped_events)} events from NYC Council calendar.")
-            # Process scraped events
-            for event in scraped_events:
-                event["impact_summary"] = generate_impact_summary(event["title"], "")
-                coordinates = geocode_address(event["location"])
-                event["coordinates"] = coordinates
+            
+            # Filter by borough before any Gemini or geocoding work is spent on events
+            if borough:
+                needle = _BOROUGH_NEEDLES.get(borough.strip().title(), borough.strip().lower())
+                scraped_events = [event for event in scraped_events if needle in event["location"].lower()]
+                if not scraped_events:
+                    print(f"⚠️ No council events found in borough: {borough}")
+                    return []
+            # Process scraped events: one Gemini request for all summaries and
+            # one concurrent pass geocoding all locations
+            summaries = generate_impact_summaries([(event["title"], "") for event in scraped_events])
+            coords_by_location = geocode_many([event["location"] for event in scraped_events])
+            for event, summary in zip(scraped_events, summaries):
+                event["impact_summary"] = summary
+                event["coordinates"] = coords_by_location.get(event["location"], {})
             return scraped_events
     
     except Exception as e:
         print(f"❌ Scraping failed: {e}")
     
     return []
-        if borough in borough_locations:
-            future_events = [e for e in future_events if borough_locations[borough].lower() in e["location"].lower()]
-    
-    # Generate impact summaries and geocode
-    for event in future_events:
-        event["impact_summary"] = generate_impact_summary(event["title"], "")
-        coordinates = geocode_address(event["location"])
-        event["coordinates"] = coordinates
-    
-    print(f"✅ Found {len(future_events)} NYC Council events for the next {days_ahead} days.")
-    return future_events
 
 def get_nyc_parks_events(days_ahead: int = 7, borough: str = None) -> list:
     """
@@ -199,6 +431,18 @@ def get_nyc_parks_events(days_ahead: int = 7, borough: str = None) -> list:
         A list of dictionaries, each representing a cleaned event.
         Returns an empty list if no events are found or the API call fails.
     """
+    try:
+        return _clean_parks_events(_fetch_parks_raw(days_ahead, borough), days_ahead)
+    except Exception as e:
+        print(f"❌ An unexpected error occurred: {e}")
+        return []
+
+
+def _fetch_parks_raw(days_ahead: int = 7, borough: str = None) -> list:
+    """
+    Fetch the raw NYC Parks event rows (one Socrata request, no paid calls).
+    Returns an empty list if the API call fails.
+    """
     try:
         # 1. Calculate the date range (SoQL query logic)
         start_date = datetime.now().strftime('%Y-%m-%d')
@@ -227,54 +471,12 @@ def get_nyc_parks_events(days_ahead: int = 7, borough: str = None) -> list:
             "$$app_token": os.getenv("NYC_OPEN_DATA_TOKEN") # Use App Token for better limits
         }
         
-        # 4. Make the API Call with retry logic for rate limits
-        max_retries = 3
-        for attempt in range(max_retries):
-            response = requests.get(NYC_PARKS_API_ENDPOINT, params=params)
-            if response.status_code == 200:
-                break
-            elif response.status_code == 429:  # Rate limited
-                wait_time = 2 ** attempt  # Exponential backoff
-                print(f"⚠️ Rate limited. Waiting {wait_time} seconds...")
-                time.sleep(wait_time)
-            else:
-                response.raise_for_status()
-        else:
-            print("❌ Failed after retries due to rate limiting")
-            return []
-        
-        raw_events = response.json()
+        # 4. Make the API Call (the session's Retry adapter backs off on 429s)
+        response = _session.get(NYC_PARKS_API_ENDPOINT, params=params, timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
         
-        # 5. Data Cleaning and Formatting
-        cleaned_events = []
-        for event in raw_events:
-            # Combine date and start_time for date_time
-            date_str = event.get("date", "")
-            time_str = event.get("start_time", "")
-            if date_str and time_str:
-                # Assume date is YYYY-MM-DD and time is HH:MM
-                date_time = f"{date_str}T{time_str}:00Z"
-            else:
-                date_time = date_str or ""
-            
-            # Geocode the location
-            location_str = event.get("location_description", "")
-            coordinates = geocode_address(location_str)
-            
-            cleaned_events.append({
-                "id": event.get("event_id"),
-                "title": event.get("title"),
-                "impact_summary": generate_impact_summary(event.get("title", ""), event.get("description", "")), 
-                "date_time": date_time,
-                "location": location_str,
-                "topic": "Community/Parks", 
-                "link": f"https://www.nyc.gov/site/nycgov/agencies/events/{event.get('url', '')}" if event.get("url") else "",
-                "coordinates": coordinates,  # Added geocoding
-                "raw_description": event.get("description") 
-            })
-
-        print(f"✅ Found {len(cleaned_events)} events for the next {days_ahead} days.")
-        return cleaned_events
+        # orjson decodes the (up to $limit=1000 rows) payload straight from bytes
+        return orjson.loads(response.content)
 
     except requests.exceptions.RequestException as e:
         print(f"❌ API Request Error: {e}")
@@ -283,11 +485,69 @@ def get_nyc_parks_events(days_ahead: int = 7, borough: str = None) -> list:
         print(f"❌ An unexpected error occurred: {e}")
         return []
 
+
+def _clean_parks_events(raw_events: list, days_ahead: int) -> list:
+    """Summarize, geocode and clean raw NYC Parks rows from _fetch_parks_raw."""
+    # 5. Summarize all events in one Gemini request and geocode every
+    #    distinct location concurrently, up front
+    summaries = generate_impact_summaries([
+        (event.get("title", ""), event.get("description", "")) for event in raw_events
+    ])
+    coords_by_location = geocode_many([event.get("location_description", "") for event in raw_events])
+    
+    # 6. Data Cleaning and Formatting
+    cleaned_events = []
+    for event, summary in zip(raw_events, summaries):
+        # Combine date and start_time for date_time
+        date_str = event.get("date", "")
+        time_str = event.get("start_time", "")
+        if date_str and time_str:
+            # Assume date is YYYY-MM-DD and time is HH:MM
+            date_time = f"{date_str}T{time_str}:00Z"
+        else:
+            date_time = date_str or ""
+    
+        location_str = event.get("location_description", "")
+        coordinates = coords_by_location.get(location_str, {})
+    
+        cleaned_events.append({
+            "id": event.get("event_id"),
+            "title": event.get("title"),
+            "impact_summary": summary, 
+            "date_time": date_time,
+            "location": location_str,
+            "topic": "Community/Parks", 
+            "link": f"https://www.nyc.gov/site/nycgov/agencies/events/{event.get('url', '')}" if event.get("url") else "",
+            "coordinates": coordinates,  # Added geocoding
+            "raw_description": event.get("description") 
+        })
+    
+    print(f"✅ Found {len(cleaned_events)} events for the next {days_ahead} days.")
+    return cleaned_events
+
 # --- FastAPI Backend ---
-from fastapi import FastAPI, HTTPException
+import asyncio
+import time
+from collections import defaultdict
+from typing import Optional
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+
+# Upstream calendars change at most hourly; serve repeat polls from memory
+EVENTS_CACHE_TTL = 600  # seconds
+EVENTS_CACHE_SIZE = 64
 
-app = FastAPI(title="Civic Scout Agent API", description="API for fetching NYC civic events")
+# (days_ahead, borough) -> (monotonic expiry, response); oldest entry evicted first
+_events_cache = {}
+# One lock per key so a cold miss runs the fetch once while other callers wait
+_events_locks = defaultdict(asyncio.Lock)
+
+app = FastAPI(
+    title="Civic Scout Agent API",
+    description="API for fetching NYC civic events",
+    default_response_class=ORJSONResponse
+)
 
 # Add CORS middleware to allow requests from the React frontend
 app.add_middleware(
@@ -299,22 +559,62 @@ app.add_middleware(
 )
 
 @app.get("/api/events")
-async def get_events(days_ahead: int = 7, borough: str = None):
+async def get_events(
+    days_ahead: int = Query(default=7, ge=1, le=90),
+    borough: Optional[str] = Query(
+        default=None,
+        pattern=r"(?i)^\s*(bronx|brooklyn|manhattan|queens|staten island)\s*$"
+    )
+):
     """
     Get NYC civic events.
     
-    - **days_ahead**: Number of days ahead to look for events (default: 7)
-    - **borough**: Optional borough filter
+    - **days_ahead**: Number of days ahead to look for events (1-90, default: 7)
+    - **borough**: Optional borough filter (one of the five boroughs)
     """
+    # Bounded params keep the cache and lock maps to a fixed key space
+    if borough:
+        borough = borough.strip().title()
+    key = (days_ahead, borough)
+    cached = _events_cache.get(key)
+    if cached:
+        if cached[0] > time.monotonic():
+            return cached[1]
+        del _events_cache[key]
+    
     try:
-        # Try NYC Council events first
-        events = get_nyc_council_events(days_ahead, borough)
-        
-        # If no council events, fall back to parks events
-        if not events:
-            events = get_nyc_parks_events(days_ahead, borough)
-        
-        return {"events": events, "count": len(events)}
+        async with _events_locks[key]:
+            # Another request may have filled the cache while we waited
+            cached = _events_cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+            
+            # The tools are blocking (requests, googlemaps, Gemini), so they run in a
+            # worker thread and the event loop stays free for other requests.
+            # Only the cheap raw parks fetch starts alongside the council fetch;
+            # a to_thread worker can't be cancelled, so the paid summaries and
+            # geocoding wait until the council list turns out empty
+            parks_raw = asyncio.ensure_future(asyncio.to_thread(_fetch_parks_raw, days_ahead, borough))
+            
+            # Try NYC Council events first
+            events = await asyncio.to_thread(get_nyc_council_events, days_ahead, borough)
+            
+            # If no council events, fall back to parks events
+            if not events:
+                events = await asyncio.to_thread(_clean_parks_events, await parks_raw, days_ahead)
+            
+            result = {"events": events, "count": len(events)}
+            # Empty results usually mean an upstream failure; don't pin them for the TTL
+            if events:
+                _events_cache.pop(key, None)
+                if len(_events_cache) >= EVENTS_CACHE_SIZE:
+                    oldest = next(iter(_events_cache))
+                    del _events_cache[oldest]
+                    # Drop its lock too unless a fill for that key is in progress
+                    if not _events_locks[oldest].locked():
+                        del _events_locks[oldest]
+                _events_cache[key] = (time.monotonic() + EVENTS_CACHE_TTL, result)
+            return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 